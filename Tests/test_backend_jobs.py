@@ -73,6 +73,44 @@ def test_fuzzy_rematch_fills_match_cells():
             assert rows[1]["cells"]["Input Port (Match)"]["widget_text"].startswith("Engine_Update")
 
 
+def test_fuzzy_rematch_writes_back_to_stored_row_index():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "p.arch")
+        db = make_project_db(
+            path,
+            layout=[("Input Port", "Port Search", True), ("Input Port (Match)", "Static Text", True)],
+            models=[{"name": "Arch_A", "status": "In Work", "rows": [
+                {"Input Port": {"text": "sensor_read"}, "Input Port (Match)": {"text": ""}},
+                {"Input Port": {"text": "deleted"}, "Input Port (Match)": {"text": ""}},
+                {"Input Port": {"text": "engine_update"}, "Input Port (Match)": {"text": ""}},
+            ]}],
+            releases=[{"name": "R1", "elf_hash": "h1", "elf_path": "/tmp/x.elf"}])
+        mid = db.get_all_models()[0]["id"]
+        db.delete_model_row(mid, 1)  # row_index is now 0, 2
+        db.register_elf("h1", "/tmp/x.elf", "test")
+        db.bulk_insert_functions("h1", [
+            {"name": n, "address": 0, "size": 0, "parameters": [], "return_type": None}
+            for n in ["Sensor_Read", "Engine_Update"]])
+        db.set_active_release(db.get_all_releases()[0]["id"])
+        db.commit(); db.close()
+
+        app = create_app(token=TOKEN)
+        with TestClient(app) as c:
+            c.post("/api/project/open", json={"path": path, "mode": "exclusive"}, headers=AUTH)
+            body = _run(c, "fuzzy_rematch", {})
+            assert body["status"] == "done", body
+            assert body["result"]["cells_changed"] == 2
+
+        from Application_Logic.Logic_Database import ProjectDatabase
+        db = ProjectDatabase()
+        db.open(path)
+        indexed = db.get_model_rows_indexed(mid)
+        db.close()
+        assert [idx for idx, _ in indexed] == [0, 2]
+        assert indexed[1][1]["Input Port"]["text"] == "engine_update"
+        assert indexed[1][1]["Input Port (Match)"]["widget_text"].startswith("Engine_Update")
+
+
 def test_fuzzy_rematch_no_elf_fails():
     with tempfile.TemporaryDirectory() as d:
         path = os.path.join(d, "p.arch")
@@ -8,6 +8,7 @@ cache round-trip, and the DB-backed flush/load/streaming/export paths.
 """
 import os
 import sys
+import json
 import logging
 import tempfile
 from pathlib import Path
@@ -15,7 +16,7 @@ from pathlib import Path
 logging.disable(logging.CRITICAL)
 sys.path.append(os.path.abspath("src"))
 
-from core.elf_parser import ELFParser
+from core.elf_parser import ELFParser, Symbol, Function, SymbolTable
 from Application_Logic.Logic_Database import ProjectDatabase
 
 ELF = str(Path(__file__).parent / "Resources" / "sample.elf")
@@ -52,6 +53,39 @@ def test_dwarf_function_parameters():
     assert "*" in dist_param["type"]
 
 
+def test_get_parameters_for_is_lazy():
+    full = _loaded_parser()
+    p = ELFParser()
+    p.load_elf(ELF)
+    for f in full.functions:
+        assert p.get_parameters_for(f.name) == f.parameters, f.name
+    assert not p.functions  # answered without a full extraction
+    assert p.get_parameters_for("does_not_exist") == []
+
+
+
+def test_get_parameters_for_trusts_harvested_empty_lists(monkeypatch):
+    p = _loaded_parser()
+
+    def _no_walk():
+        raise AssertionError("DWARF re-walked after extract_all")
+    monkeypatch.setattr(p, "_get_dwarf_info", _no_walk)
+    # No parameters after a harvest is an answer, not "not extracted yet".
+    assert p.get_parameters_for(Function("no_args", 0x10, 4, [])) == []
+    assert p.get_parameters_for("does_not_exist") == []
+    add = p.search_function("add", exact=True)[0]
+    assert p.get_parameters_for(add) is add.parameters
+
+
+def test_get_parameters_for_keys_on_the_selected_function():
+    full = _loaded_parser()
+    p = ELFParser()
+    p.load_elf(ELF)
+    for f in full.functions:
+        # A Function is looked up by its own address, not just its name.
+        assert p.get_parameters_for(Function(f.name, f.address, f.size, [])) == f.parameters
+        assert (f.name, p._normalize_address(f.address)) in p._param_cache
+
 def test_dwarf_structures_and_globals():
     p = _loaded_parser()
     assert "Point" in p.structures
@@ -60,6 +94,167 @@ def test_dwarf_structures_and_globals():
     assert p.global_vars_dwarf.get("global_counter") == "int"
 
 
+def test_typedefs_resolve_from_walk_offsets():
+    p = _loaded_parser()
+    assert p.structures["Point_t"] == p.structures["Point"]
+
+    # The dict answers must agree with walking the DIE chain for every typedef.
+    p = ELFParser()
+    p.load_elf(ELF)
+    dwarfinfo = p._get_dwarf_info()
+    links, resolved_at, typedef_offsets = {}, {}, []
+    for CU in dwarfinfo.iter_CUs():
+        for DIE in CU.iter_DIEs():
+            if DIE.tag and DIE.tag != 'DW_TAG_compile_unit':
+                p._note_type_DIE(DIE, links, resolved_at)
+            if DIE.tag == 'DW_TAG_typedef':
+                typedef_offsets.append(DIE.offset)
+    assert typedef_offsets
+    for offset in typedef_offsets:
+        assert (p._resolve_typedef_at(dwarfinfo, offset, links, resolved_at)
+                == p._resolve_typedef(dwarfinfo, offset))
+
+
+def test_symbol_and_function_are_slotted():
+    # Hundreds of thousands of these live at once on a real firmware ELF; a
+    # per-instance __dict__ would roughly double their footprint.
+    sym = Symbol("a", 0x10, 4, "STT_FUNC", "STB_GLOBAL", ".text")
+    fn = Function("a", 0x10, 4, [])
+    assert not hasattr(sym, "__dict__")
+    assert not hasattr(fn, "__dict__")
+
+
+def test_symbol_table_is_columnar_and_round_trips():
+    p = _loaded_parser()
+    assert isinstance(p.symbols, SymbolTable)
+    raw = list(p._generate_symbols())
+    assert p.symbols == raw
+    assert p.symbols[-1] == raw[-1] and p.symbols[1:3] == raw[1:3]
+    # each distinct type/binding/section label is stored once
+    labels = p.symbols._labels
+    assert len(labels) == len(set(labels))
+    assert labels.count("STT_FUNC") == 1
+    funcs = [sym for sym in p.symbols if sym.symbol_type == "STT_FUNC"]
+    assert all(sym.symbol_type is sys.intern("STT_FUNC") for sym in funcs)
+    # names stay raw bytes until read, then decode like pyelftools does
+    t = SymbolTable.from_records([(b"ok", 1, 0, "STT_FUNC", "STB_LOCAL", ".text"),
+                                  (b"bad\xff", 2, 0, "STT_FUNC", "STB_LOCAL", ".text")])
+    assert t.name(0) == "ok" and t[1].name == "bad\ufffd"
+
+
+def test_raw_symbol_unpack_matches_pyelftools():
+    from elftools.elf.sections import SymbolTableSection
+    p = ELFParser()
+    p.load_elf(ELF)
+    expected = []
+    for sec in p.elf_file.iter_sections():
+        if isinstance(sec, SymbolTableSection):
+            for sym in sec.iter_symbols():
+                if sym.name:
+                    info = sym["st_info"]
+                    expected.append((sym.name, sym["st_value"], sym["st_size"],
+                                     info["type"], info["bind"]))
+    got = [(s.name, s.address, s.size, s.symbol_type, s.binding)
+           for s in p._generate_symbols()]
+    assert got == expected
+
+
+def test_sym_parsers_cover_every_class_and_byte_order():
+    import struct
+    from core.elf_parser import _SYM_PARSERS
+    for (elfclass, little), parse in _SYM_PARSERS.items():
+        e = "<" if little else ">"
+        if elfclass == 64:
+            raw = struct.pack(e + "IBBHQQ", 7, 0x12, 0, 3, 0x8000, 16)
+        else:
+            raw = struct.pack(e + "IIIBBH", 7, 0x8000, 16, 0x12, 0, 3)
+        assert list(parse(raw * 2, 0)) == [(7, 0x8000, 16, 0x12, 3)] * 2
+        # A padded stride is honoured instead of assuming packed entries.
+        padded = raw + b"\0" * 8
+        assert list(parse(padded * 2, len(padded))) == [(7, 0x8000, 16, 0x12, 3)] * 2
+
+
+def test_reserved_and_bogus_section_indices_map_to_unknown():
+    p = ELFParser()
+    p.load_elf(ELF)
+    # (st_name, value, size, info=GLOBAL|FUNC, shndx); st_name 1 is the first
+    # string in .strtab, so every record is named.
+    records = [(1, 0, 0, 0x12, shndx) for shndx in (0, 0xfff1, 0xfff2, 0xffff, 9999)]
+    p._iter_raw_symbols = lambda section, data=None: iter(records)
+    sections = [r[5] for r in p._iter_symbol_records()]
+    assert sections[:5] == ["UNDEF", "ABS", "UNKNOWN", "UNKNOWN", "UNKNOWN"]
+
+
+def test_symbol_tables_decode_in_threads_without_gil(monkeypatch):
+    import core.elf_parser as elf_parser
+    p = ELFParser()
+    p.load_elf(ELF)
+    serial = list(p._iter_symbol_records())
+    tables = p._get_symbol_tables()
+    monkeypatch.setattr(p, "_get_symbol_tables", lambda: tables * 2)
+    monkeypatch.setattr(elf_parser, "_gil_enabled", lambda: False)
+    assert list(p._iter_symbol_records()) == serial * 2
+
+
+def test_extract_symbols_kinds_filter():
+    p = ELFParser()
+    p.load_elf(ELF)
+    funcs = p.extract_symbols(kinds={"STT_FUNC"})
+    assert funcs and all(s.symbol_type == "STT_FUNC" for s in funcs)
+    assert p.symbols == []  # a filtered call does not populate the full table
+    full = p.extract_symbols()
+    assert list(p.extract_symbols(kinds={"STT_FUNC"})) == [s for s in full if s.symbol_type == "STT_FUNC"]
+
+
+def test_extract_functions_streams_symbols():
+    p = ELFParser()
+    p.load_elf(ELF)
+    names = {f.name for f in p.extract_functions()}
+    assert {"add", "sub", "compute", "dist"} <= names
+    # Functions were filtered straight off the symbol table — no Symbol list kept.
+    assert p.symbols == []
+    assert any(s.name == "add" for s in p.iter_symbols())
+
+
+def test_single_pass_buckets_match_separate_extraction():
+    fused = ELFParser()
+    fused.load_elf(ELF)
+    fused._extract_symbols_and_functions()
+    separate = ELFParser()
+    separate.load_elf(ELF)
+    assert list(fused.functions) == separate.extract_functions()
+    assert fused.symbols == separate.extract_symbols()
+    # A full extract_symbols() fills the function list in the same scan.
+    p = ELFParser()
+    p.load_elf(ELF)
+    p.extract_symbols()
+    assert p.functions == fused.functions
+
+
+def test_parallel_dwarf_matches_serial():
+    serial = _loaded_parser()
+    p = ELFParser()
+    p.load_elf(ELF)
+    p.extract_symbols()
+    p.extract_functions()
+    # Force the process pool even for the single-CU fixture.
+    assert p._extract_dwarf_parallel(max_workers=2, min_cus=1, structures=True) is True
+    assert p.global_vars_dwarf == serial.global_vars_dwarf
+    assert p.structures == serial.structures
+    assert ({f.name: f.parameters for f in p.functions}
+            == {f.name: f.parameters for f in serial.functions})
+
+
+def test_dwarf_worker_count_is_capped_and_clamped(monkeypatch):
+    from core import elf_parser
+    monkeypatch.delenv("ARCH_DWARF_WORKERS", raising=False)
+    monkeypatch.setattr(elf_parser.os, "cpu_count", lambda: 64)
+    assert elf_parser._dwarf_worker_count() == elf_parser.DWARF_MAX_WORKERS
+    for value, expected in (("16", 16), ("0", 1), ("-3", 1), ("bogus", elf_parser.DWARF_MAX_WORKERS)):
+        monkeypatch.setenv("ARCH_DWARF_WORKERS", value)
+        assert elf_parser._dwarf_worker_count() == expected, value
+
+
 # --------------------------------------------------------------------------
 # Lookups
 # --------------------------------------------------------------------------
@@ -69,6 +264,24 @@ def test_search_function_exact_fuzzy_and_missing():
     assert [f.name for f in p.search_function("add", exact=True)] == ["add"]
     assert "compute" in [f.name for f in p.search_function("comp")]
     assert p.search_function("does_not_exist", exact=True) == []
+    # a fuzzy search lists the exact name first
+    p.functions.insert(0, Function("add_helper", 0xCAFE0, 4, []))
+    assert [f.name for f in p.search_function("add")][:2] == ["add", "add_helper"]
+    assert "add_helper" in [f.name for f in p.search_function("D_HEL")]
+
+
+def test_substring_index_matches_linear_scan():
+    from core.elf_parser import _search_index, _substring_indices
+    names = ["Point", "point_t", "Motor_Cfg", "MOTOR", "x"]
+    index = _search_index(names)
+    for needle in ("point", "motor", "t", "x", "zz", "t\nm"):
+        expected = [i for i, n in enumerate(names) if needle in n.lower()]
+        assert _substring_indices(index, needle, names) == expected, needle
+    # lower() lengthens "İ", so the buffer is abandoned for a per-name scan.
+    odd = ["İx", "ax"]
+    assert _search_index(odd)[0] is None
+    assert _substring_indices(_search_index(odd), "x", odd) == [0, 1]
+    assert _substring_indices(_search_index([]), "x", []) == []
 
 
 def test_get_symbol_by_address():
@@ -81,6 +294,16 @@ def test_get_symbol_by_address():
     assert p.get_symbol_by_address(0xDEADBEEF) is None
 
 
+def test_lookup_indices_follow_list_changes():
+    p = _loaded_parser()
+    assert p.search_function("late_fn", exact=True) == []
+    late = Function("late_fn", 0xCAFE0, 4, [])
+    p.functions.append(late)
+    assert p.search_function("late_fn", exact=True) == [late]
+    p.symbols = [Symbol("only", 0x10, 4, "STT_OBJECT", "STB_GLOBAL", ".data")]
+    assert p.get_symbol_by_address(0x10).name == "only"
+
+
 def test_get_function_containing_address():
     p = _loaded_parser()
     add = p.search_function("add", exact=True)[0]
@@ -101,6 +324,32 @@ def test_get_function_bytes():
     code = p.get_function_bytes(add)
     assert isinstance(code, (bytes, bytearray))
     assert len(code) > 0
+    # Clamped to the section end; addresses outside any code section miss.
+    starts, spans, ordered = p._get_exec_sections()
+    assert ordered is None  # linked image: no overlapping sections
+    start, end, _ = spans[-1]
+    assert len(p.get_function_bytes(Function("tail", end - 4, 64, []))) == 4
+    assert p.get_function_bytes(Function("before", starts[0] - 16, 4, [])) == b""
+    assert p.get_function_bytes(Function("after", end + 16, 4, [])) == b""
+
+
+def test_get_function_bytes_overlapping_sections_keep_header_order():
+    class _Section(dict):
+        def data(self):
+            return self["bytes"]
+
+    def _section(addr, flags, payload):
+        return _Section(sh_addr=addr, sh_size=len(payload), sh_flags=flags, bytes=payload)
+
+    # Relocatable-object layout: every section at address 0. The first
+    # executable section in header order wins, as with the plain scan.
+    p = _loaded_parser()
+    p._sections = [_section(0, 0x2, b"DATA"), _section(0, 0x6, b"\x01\x02\x03\x04"),
+                   _section(0, 0x6, b"\xff\xfe\xfd\xfc\xfb\xfa"), _section(0, 0x6, b"")]
+    p._exec_sections = None
+    assert p.get_function_bytes(Function("f", 0, 2, [])) == b"\x01\x02"
+    assert p.get_function_bytes(Function("g", 4, 1, [])) == b"\xfb"
+    assert p.get_function_bytes(Function("h", 6, 1, [])) == b""
 
 
 def test_extract_subcalls():
@@ -113,6 +362,27 @@ def test_extract_subcalls():
     result = p.extract_subcalls("compute")
     assert isinstance(result, list)
     assert not any("error" in str(r).lower() for r in result)
+    # The configured engine is reused rather than rebuilt per call.
+    assert p._get_capstone_instance(0) is p._get_capstone_instance(0)
+
+
+def test_capstone_is_imported_on_first_disassembly():
+    import subprocess
+    src = os.path.abspath("src")
+    probe = ("import sys; sys.path.insert(0, %r); import core.elf_parser as e; "
+             "print('capstone' in sys.modules, e._capstone() is not None, 'capstone' in sys.modules)" % src)
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "True", "True"]
+
+
+def test_call_operand_parsing_accepts_only_immediates():
+    from core.elf_parser import _CALL_MNEMONICS, _IMM_OPERAND_RE
+    assert {"bl", "call", "jal", "fcall"} <= _CALL_MNEMONICS
+    for op_str, value in (("0x400120", "0x400120"), ("#0x1000", "0x1000"),
+                          ("#-0x10", "-0x10"), ("12", "12")):
+        assert _IMM_OPERAND_RE.fullmatch(op_str).group(1) == value
+    for op_str in ("r3", "$t9", "qword ptr [rip + 0x2f]", "[r0, #4]"):
+        assert _IMM_OPERAND_RE.fullmatch(op_str) is None
 
 
 def test_get_statistics_in_memory():
@@ -120,6 +390,9 @@ def test_get_statistics_in_memory():
     stats = p.get_statistics()
     assert stats["functions"] >= 4
     assert stats["total_symbols"] >= len(p.functions)
+    assert stats["global_symbols"] >= 4  # add/sub/compute/main are extern
+    assert (stats["global_symbols"] + stats["local_symbols"] + stats["weak_symbols"]
+            <= stats["total_symbols"])
 
 
 # --------------------------------------------------------------------------
@@ -130,7 +403,7 @@ def test_save_and_load_cache_roundtrip():
     p = _loaded_parser()
     with tempfile.TemporaryDirectory() as tmp:
         cache = os.path.join(tmp, "cache.json")
-        p.save_cache(cache)
+        assert p.save_cache(cache) is True
         assert os.path.exists(cache)
 
         p2 = ELFParser()
@@ -144,6 +417,37 @@ def test_save_and_load_cache_roundtrip():
 # DB-backed paths
 # --------------------------------------------------------------------------
 
+def test_file_md5_matches_in_memory_hash():
+    p = ELFParser()
+    p.load_elf(ELF)
+    assert p._calculate_md5() == p.md5_hash
+
+
+def test_save_cache_escapes_elf_path():
+    p = _loaded_parser()
+    p.elf_path = Path('C:\\fw\\"quoted"\\app.elf')
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "cache.json")
+        p.save_cache(cache)
+        with open(cache) as f:
+            data = json.load(f)
+    assert data["elf_path"] == str(p.elf_path)
+    assert len(data["symbols"]) == len(p.symbols)
+
+
+def test_save_cache_stdlib_fallback_matches_orjson(monkeypatch):
+    import core.elf_parser as elf_parser
+    p = _loaded_parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        fast, slow = os.path.join(tmp, "fast.json"), os.path.join(tmp, "slow.json")
+        p.save_cache(fast)
+        monkeypatch.setattr(elf_parser, "ORJSON_AVAILABLE", False)
+        monkeypatch.setattr(elf_parser, "_JSON_BATCH", 3)  # several batches
+        p.save_cache(slow)
+        with open(fast) as f1, open(slow) as f2:
+            assert json.load(f1) == json.load(f2)
+
+
 def test_flush_to_db_and_load_from_db():
     with tempfile.TemporaryDirectory() as tmp:
         db = ProjectDatabase()
@@ -161,6 +465,7 @@ def test_flush_to_db_and_load_from_db():
         assert p2.symbols == []
         stats = p2.get_statistics()
         assert stats["functions"] >= 4
+        assert stats["global_symbols"] == p.get_statistics()["global_symbols"]
         # DB-backed subcall path rebuilds the address map from the DB
         assert isinstance(p2.extract_subcalls("add"), list)
         db.close()
@@ -202,6 +507,104 @@ def test_export_elf_cache():
         db.close()
 
 
+# --------------------------------------------------------------------------
+# Non-interactive CLI
+# --------------------------------------------------------------------------
+
+def test_cli_batch_mode(capsys):
+    from core.elf_parser import main
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "dump.json")
+        assert main(["--elf", ELF, "--search", "add", "--dump-json", out]) == 0
+        assert os.path.exists(out)
+    printed = capsys.readouterr().out
+    assert "4 functions" in printed and "name='add'" in printed
+    assert main(["--elf", "/does/not/exist.elf", "--no-dwarf"]) == 1
+
+
+def test_cli_batch_dump_failure_exits_nonzero(monkeypatch, tmp_path):
+    from core import elf_parser
+    stale = tmp_path / "dump.json"
+    stale.write_text("{}")  # left over from an earlier run
+
+    def _fail(f, rows):
+        raise OSError("disk full")
+    monkeypatch.setattr(elf_parser, "_write_json_array", _fail)
+    assert elf_parser.main(["--elf", ELF, "--no-dwarf", "--dump-json", str(stale)]) == 1
+
+
+def test_cli_interactive_piped_input_ends_cleanly(monkeypatch, tmp_path, capsys):
+    import io
+    from core.elf_parser import _interactive_main
+    monkeypatch.chdir(tmp_path)
+    # The script stops mid-session; running out of input quits instead of
+    # surfacing EOFError (which used to end in sys.exit(1)).
+    monkeypatch.setattr(sys, "stdin", io.StringIO(f"1\n{ELF}\n2\npoint\n1\n"))
+    _interactive_main()
+    printed = capsys.readouterr().out
+    assert "[Struct] Point" in printed and "  - x: int" in printed
+
+
+def test_cli_stale_cache_is_not_decoded(monkeypatch, tmp_path, capsys):
+    import io
+    from core.elf_parser import _interactive_main, _peek_cache_hash
+    (tmp_path / "Resources").mkdir()
+    cache = tmp_path / "Resources" / (os.path.basename(ELF) + ".json")
+    p = _loaded_parser()
+    p.save_cache(str(cache))
+    assert _peek_cache_hash(cache) == p.md5_hash
+    cache.write_bytes(cache.read_bytes().replace(p.md5_hash.encode(), b"0" * 32))
+
+    def _no_load(self, path):
+        raise AssertionError("stale cache was decoded")
+    monkeypatch.setattr(ELFParser, "load_cache", _no_load)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(f"1\n{ELF}\nq\n"))
+    _interactive_main()
+    assert "MD5 mismatch" in capsys.readouterr().out
+    assert _peek_cache_hash(cache) == p.md5_hash  # re-parsed and re-saved
+
+
+def test_cli_struct_tree_expands_shared_structs_once(monkeypatch, tmp_path, capsys):
+    import io
+    from core.elf_parser import _interactive_main
+    # S0..S39 each hold two S{i+1} fields: a per-path walk would print 2**40 lines.
+    structures = {f"S{i}": [{"name": "l", "type": f"S{i + 1}"},
+                            {"name": "r", "type": f"S{i + 1} *"}] for i in range(40)}
+    structures["S0"].append({"name": "back", "type": "struct S0*"})
+    (tmp_path / "Resources").mkdir()
+    (tmp_path / "Resources" / "dag.json").write_text(json.dumps(
+        {"elf_path": "", "elf_hash": "x", "symbols": [], "functions": [],
+         "structures": structures, "global_vars": {}}))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO("2\n1\n2\nS0\n1\n"))
+    _interactive_main()
+    printed = capsys.readouterr().out
+    assert printed.count("Structure: ") == 40
+    assert "...(already shown: S1)" in printed
+    assert "...(recursive S0)" in printed
+
+
+def test_cli_struct_search_pages_matches(monkeypatch, tmp_path, capsys):
+    import io
+    from core.elf_parser import _interactive_main, _CLI_PAGE_SIZE
+    structures = {f"T{i}": [{"name": "x", "type": "int"}] for i in range(_CLI_PAGE_SIZE + 5)}
+    (tmp_path / "Resources").mkdir()
+    (tmp_path / "Resources" / "paged.json").write_text(json.dumps(
+        {"elf_path": "", "elf_hash": "x", "symbols": [], "functions": [],
+         "structures": structures, "global_vars": {"t_var": "T3"}}))
+    monkeypatch.chdir(tmp_path)
+    # First page, "m" for the remaining structs plus the variable, then pick the last.
+    last = _CLI_PAGE_SIZE + 6
+    monkeypatch.setattr(sys, "stdin", io.StringIO(f"2\n1\n2\nt\nm\n{last}\n"))
+    _interactive_main()
+    printed = capsys.readouterr().out
+    assert f"Matches 1-{_CLI_PAGE_SIZE}:" in printed and "m for more" in printed
+    assert f"Matches {_CLI_PAGE_SIZE + 1}-{last}:" in printed
+    assert f"{last}. [Variable] t_var (Type: T3)" in printed
+    assert "Variable: t_var" in printed and "Structure: T3" in printed
+
+
 if __name__ == "__main__":
     import pytest
     raise SystemExit(pytest.main([__file__, "-v"]))
@@ -360,6 +360,28 @@ class TestSymbolMatcherRapidfuzz:
         assert name is not None
         assert "Motor" in name
 
+    def test_rematch_rows_reports_touched_rows(self):
+        from Application_Logic.Logic_Symbol_Matcher import rematch_rows
+        matcher = self._make_matcher(["HAL_GPIO_Init", "HAL_UART_Init"])
+        rows = [
+            {"Port": {"text": "GPIO_Init"}},
+            {"Port": {"text": ""}},
+            {"Port": {"text": "UART_Init"}, "Port (Match)": {"text": ""}},
+        ]
+        touched = set()
+        changed = rematch_rows(rows, [("Port", "Port (Match)", "function")], matcher,
+                               changed_rows=touched)
+        assert changed == 2
+        assert touched == {0, 2}
+        assert rows[0]["Port (Match)"]["widget_text"].startswith("HAL_GPIO_Init")
+        assert "Port (Match)" not in rows[1]
+
+        # A second pass over unchanged rows is a no-op: nothing to re-save.
+        touched.clear()
+        assert rematch_rows(rows, [("Port", "Port (Match)", "function")], matcher,
+                            changed_rows=touched) == 0
+        assert touched == set()
+
     def test_get_matches_for_list(self):
         matcher = self._make_matcher(["HAL_GPIO_Init", "HAL_UART_Init", "SystemClock_Config"])
         port_list = ["HAL_GPIO_Init", "SystemClock_Config"]
@@ -1035,6 +1035,18 @@ class ProjectDatabase:
             )
             return [json.loads(self._dec_text("A", r[0])) for r in cur.fetchall()]
 
+    def get_model_rows_indexed(self, model_id: int) -> list:
+        """``[(row_index, row_data)]`` in row order. Indices are not guaranteed
+        contiguous (rows can be deleted), so callers that write rows back by
+        index must use these rather than list positions."""
+        with _timed("get_model_rows_indexed", model_id=model_id):
+            cur = self._conn.execute(
+                "SELECT row_index, row_data FROM architecture_rows"
+                " WHERE model_id=? ORDER BY row_index",
+                (model_id,)
+            )
+            return [(r[0], json.loads(self._dec_text("A", r[1]))) for r in cur.fetchall()]
+
     def get_row_count(self, model_id: int) -> int:
         """Row count for a model without deserialising any row payloads."""
         cur = self._conn.execute(
@@ -1777,7 +1789,9 @@ class ProjectDatabase:
                 "parameters": json.loads(dec_params) if dec_params else [],
                 "return_type": self._dec_text("A", r[4])
             })
-        results.sort(key=lambda f: f["name"] != name)
+        if not exact:
+            # Exact name first; stable, so the rest keep their row order.
+            results.sort(key=lambda f: f["name"] != name)
         return results
 
     def get_all_structures(self, elf_hash: str) -> dict:
@@ -1793,16 +1807,18 @@ class ProjectDatabase:
         return {r[0]: self._dec_text("A", r[1]) for r in cur.fetchall()}
 
     def get_elf_stats(self, elf_hash: str) -> dict:
-        sym_count = self._conn.execute(
-            "SELECT COUNT(*) FROM elf_symbols WHERE elf_hash=?", (elf_hash,)
-        ).fetchone()[0]
+        # One scan of elf_symbols for the total, object and binding counts.
+        sym_count, obj_count, global_count, local_count, weak_count = (
+            v or 0 for v in self._conn.execute(
+                "SELECT COUNT(*), SUM(sym_type='STT_OBJECT'),"
+                " SUM(binding='STB_GLOBAL'), SUM(binding='STB_LOCAL'),"
+                " SUM(binding='STB_WEAK')"
+                " FROM elf_symbols WHERE elf_hash=?", (elf_hash,)
+            ).fetchone()
+        )
         func_count = self._conn.execute(
             "SELECT COUNT(*) FROM elf_functions WHERE elf_hash=?", (elf_hash,)
         ).fetchone()[0]
-        obj_count = self._conn.execute(
-            "SELECT COUNT(*) FROM elf_symbols"
-            " WHERE elf_hash=? AND sym_type='STT_OBJECT'", (elf_hash,)
-        ).fetchone()[0]
         backend = self._conn.execute(
             "SELECT parser_backend FROM elf_index WHERE elf_hash=?", (elf_hash,)
         ).fetchone()
@@ -1811,6 +1827,9 @@ class ProjectDatabase:
             "total_symbols": sym_count,
             "functions": func_count,
             "objects": obj_count,
+            "global_symbols": global_count,
+            "local_symbols": local_count,
+            "weak_symbols": weak_count,
             "parser_backend": parser_backend
         }
 
@@ -126,29 +126,42 @@ def search_specs_from_layout(layout) -> "List[Tuple[str, str, str]]":
     return specs
 
 
-def rematch_rows(rows, specs, matcher, limit: int = 10) -> int:
+def rematch_rows(rows, specs, matcher, limit: int = 10,
+                 changed_rows: Optional[set] = None) -> int:
     """Re-run fuzzy matching for every search column in ``rows`` and write the
     best ``"Name (NN%)"`` into the adjacent (Match) cell's ``widget_text``.
-    Pure (Qt-free); returns the number of cells updated. Mirrors the Qt
-    ``_match_model_data_inplace`` minus the widget styling.
+    Pure (Qt-free); returns the number of cells whose match actually changed.
+    Mirrors the Qt ``_match_model_data_inplace`` minus the widget styling.
+
+    When ``changed_rows`` is given, the list index of every touched row is added
+    to it so the caller can persist just those rows in one batch.
     """
+    # Resolve each spec's matcher method once, not per cell.
+    finders = {
+        "function": matcher.find_top_function_matches,
+        "variable": matcher.find_top_variable_matches,
+    }
+    bound = [(search_col, match_col, finders.get(kind, matcher.find_top_matches))
+             for search_col, match_col, kind in specs]
     changed = 0
-    for row in rows:
-        for search_col, match_col, kind in specs:
+    for idx, row in enumerate(rows):
+        for search_col, match_col, find in bound:
             cell = row.get(search_col)
             text = (cell.get("text", "") if isinstance(cell, dict) else "").strip()
             if not text:
                 continue
-            if kind == "function":
-                matches = matcher.find_top_function_matches(text, limit=limit)
-            elif kind == "variable":
-                matches = matcher.find_top_variable_matches(text, limit=limit)
-            else:
-                matches = matcher.find_top_matches(text, limit=limit)
+            matches = find(text, limit=limit)
             if not matches:
                 continue
             best_name, best_score = matches[0]
-            target = row.setdefault(match_col, {"text": ""})
-            target["widget_text"] = f"{best_name} ({best_score}%)"
+            match_text = f"{best_name} ({best_score}%)"
+            target = row.get(match_col)
+            if target is None:
+                target = row[match_col] = {"text": ""}
+            elif target.get("widget_text") == match_text:
+                continue    # already current — don't count (or re-save) a no-op
+            target["widget_text"] = match_text
             changed += 1
+            if changed_rows is not None:
+                changed_rows.add(idx)
     return changed
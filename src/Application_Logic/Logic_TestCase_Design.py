@@ -751,13 +751,14 @@ def is_effective_row_empty(row_bind_data, col_types=None):
     return True
 
 
-def is_row_renderable(row_bind_data, col_types=None):
+def is_row_renderable(row_bind_data, col_types=None, port_state_col=None):
     """A row produces a test case only when it is non-empty and not a
     Retired/Deleted port. Returns (renderable, reason) — reason is one of
-    'empty', 'retired'/'deleted' (the port-state value), or '' when renderable."""
+    'empty', 'retired'/'deleted' (the port-state value), or '' when renderable.
+    ``port_state_col`` skips the column lookup when the caller already has it."""
     if is_effective_row_empty(row_bind_data, col_types):
         return False, "empty"
-    psc = get_port_state_column_name(row_bind_data.keys(), col_types)
+    psc = port_state_col or get_port_state_column_name(row_bind_data.keys(), col_types)
     psv = row_bind_data.get(psc, "").strip().lower()
     if psv in ("retired", "deleted"):
         return False, psv
@@ -791,13 +792,21 @@ def build_model_markdown(model_name, effective_rows, title_template,
     ]
 
     generated = 0
+    # The Port-State / TC-ID columns depend only on a row's (ordered) key set,
+    # which nearly every row of a model shares — resolve once per shape.
+    resolved_cols = {}
     for row_bind_data in effective_rows:
-        renderable, _reason = is_row_renderable(row_bind_data, col_types)
+        shape = tuple(row_bind_data)
+        cols = resolved_cols.get(shape)
+        if cols is None:
+            cols = resolved_cols[shape] = (get_port_state_column_name(shape, col_types),
+                                           resolve_tc_id_column(shape))
+        psc, tc_id_col = cols
+        renderable, _reason = is_row_renderable(row_bind_data, col_types, port_state_col=psc)
         if not renderable:
             continue
 
         row_bind_data = dict(row_bind_data)
-        tc_id_col = resolve_tc_id_column(row_bind_data.keys())
         test_case_id = row_bind_data.get(tc_id_col, "") if tc_id_col else ""
         test_case_id = test_case_id.strip() if test_case_id and test_case_id.strip() else "NO_ID"
         if tc_id_col:
@@ -204,10 +204,17 @@ def _make_fuzzy_rematch(state: AppState):
                 if cancel.is_set():
                     break
                 progress(f"Re-matching model {i}/{len(model_ids)}…")
-                rows = wdb.get_model_rows(mid)
-                changed = rematch_rows(rows, specs, matcher)
-                if changed:
-                    wdb.save_model_rows(mid, rows)
+                indexed = wdb.get_model_rows_indexed(mid)
+                rows = [row for _, row in indexed]
+                touched: set = set()
+                changed = rematch_rows(rows, specs, matcher, changed_rows=touched)
+                if touched:
+                    # One batched upsert of just the touched rows, instead of
+                    # deleting and re-inserting (re-encrypting) the whole model.
+                    # touched holds list positions; map them back to the stored
+                    # row_index, which has gaps once a row has been deleted.
+                    wdb.upsert_model_rows_batch(
+                        mid, {indexed[pos][0]: rows[pos] for pos in sorted(touched)})
                 total += changed
             wdb.commit()
         return {"cells_changed": total, "models": len(model_ids)}
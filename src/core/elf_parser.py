@@ -10,50 +10,162 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
 import collections
+import collections.abc
+from array import array
 import sys
 import bisect
+import re
 import json
 import hashlib
+import importlib.util
 import io
 import os
-import gc
+import struct
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
 
 try:
     from elftools.elf.elffile import ELFFile
     from elftools.elf.sections import SymbolTableSection
     from elftools.dwarf.descriptions import describe_form_class
+    from elftools.elf.enums import ENUM_ST_INFO_TYPE, ENUM_ST_INFO_BIND
 except ImportError as e:
     raise ImportError(
         "pyelftools is required for ELF parsing. "
         "Install it with: pip install pyelftools"
     ) from e
 
+# Symbol-table entries are fixed-width records; they are unpacked with struct
+# rather than pyelftools' construct-based Elf_Sym (see ELFParser._iter_raw_symbols).
+# Unknown st_info values pass through as ints, exactly as pyelftools reports them.
+# Names are interned so every Symbol shares the same few str objects (and
+# equality checks against the literals in this module short-circuit on identity).
+_STT_NAMES = {v: sys.intern(k) for k, v in ENUM_ST_INFO_TYPE.items() if k != '_default_'}
+_STB_NAMES = {v: sys.intern(k) for k, v in ENUM_ST_INFO_BIND.items() if k != '_default_'}
+_SHN_LORESERVE = 0xff00
+_SHN_ABS = 0xfff1
+
+
+def _make_sym_parser(layout: struct.Struct, is64: bool):
+    """Build a ``(data, stride) -> records`` parser for one Elf_Sym layout.
+
+    Records come out as ``(st_name, st_value, st_size, st_info, st_shndx)``.
+    Class and endianness are baked in here, so nothing is re-decided per table
+    or per entry.
+    """
+    size = layout.size
+    unpack_from = layout.unpack_from
+
+    def parse(data: bytes, stride: int):
+        if stride in (0, size):  # 0: sh_entsize not set, assume packed
+            records = layout.iter_unpack(data[:len(data) - len(data) % size])
+        else:
+            records = (unpack_from(data, off)
+                       for off in range(0, len(data) - size + 1, stride))
+        if is64:
+            # Elf64_Sym: name, info, other, shndx, value, size
+            return ((n, v, sz, i, x) for n, i, _, x, v, sz in records)
+        # Elf32_Sym: name, value, size, info, other, shndx
+        return ((n, v, sz, i, x) for n, v, sz, i, _, x in records)
+
+    return parse
+
+
+_parse_sym_64_le = _make_sym_parser(struct.Struct('<IBBHQQ'), True)
+_parse_sym_64_be = _make_sym_parser(struct.Struct('>IBBHQQ'), True)
+_parse_sym_32_le = _make_sym_parser(struct.Struct('<IIIBBH'), False)
+_parse_sym_32_be = _make_sym_parser(struct.Struct('>IIIBBH'), False)
+# Keyed by (elfclass, little_endian)
+_SYM_PARSERS = {
+    (64, True): _parse_sym_64_le,
+    (64, False): _parse_sym_64_be,
+    (32, True): _parse_sym_32_le,
+    (32, False): _parse_sym_32_be,
+}
+
 try:
     import rust_elf_parser
     RUST_PARSER_AVAILABLE = True
 except ImportError:
     RUST_PARSER_AVAILABLE = False
 
-
 try:
-    import capstone
-    from capstone import (
-        Cs, CS_ARCH_ARM, CS_MODE_THUMB, CS_MODE_ARM, 
-        CS_ARCH_X86, CS_MODE_32, CS_MODE_64, 
-        CS_ARCH_ARM64, 
-        CS_ARCH_MIPS, CS_MODE_MIPS32,
-        CS_ARCH_TRICORE, CS_MODE_TRICORE_162
-    )
-    CAPSTONE_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CAPSTONE_AVAILABLE = False
-    pass
+    ORJSON_AVAILABLE = False
+
+
+# Capstone is only needed by extract_subcalls. find_spec answers "is it
+# installed" without loading the C extension and its constant tables, so
+# importing this module (CLI, cache loads, tests) does not pay for it.
+CAPSTONE_AVAILABLE = importlib.util.find_spec("capstone") is not None
+capstone = None
+
+
+def _capstone():
+    """The capstone module, imported on first use; None if it cannot load."""
+    global capstone, CAPSTONE_AVAILABLE
+    if capstone is None and CAPSTONE_AVAILABLE:
+        try:
+            import capstone as capstone_module
+            capstone = capstone_module
+        except ImportError:
+            CAPSTONE_AVAILABLE = False
+    return capstone
 
 
-#configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows per serialiser call when writing a JSON array: large enough that the
+# per-row cost stays inside orjson's C loop, small enough that a 200k-symbol
+# cache never holds more than one batch of dicts at a time.
+_JSON_BATCH = 10_000
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialise ``obj`` to UTF-8 JSON with orjson when installed, else stdlib json."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON with orjson when installed, else stdlib json."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_array(f, rows) -> None:
+    """Write ``rows`` (JSON-ready dicts) to binary file ``f`` as one JSON array."""
+    rows = iter(rows)
+    f.write(b'[')
+    sep = b''
+    while batch := list(islice(rows, _JSON_BATCH)):
+        f.write(sep + _json_bytes(batch)[1:-1])
+        sep = b','
+    f.write(b']')
+
+
+# save_cache writes "elf_path" and "elf_hash" ahead of the symbol table, so the
+# hash sits inside the first few hundred bytes of the file.
+_CACHE_HASH_RE = re.compile(rb'"elf_hash"\s*:\s*"([0-9A-Fa-f]*)"')
+_CACHE_HEAD_BYTES = 64 * 1024
+
+
+def _peek_cache_hash(cache_path) -> Optional[str]:
+    """``elf_hash`` of a JSON cache read from the file head only, or None
+    when it is not there (other layouts, unreadable file) and only a full
+    load_cache can tell."""
+    try:
+        with open(cache_path, 'rb') as f:
+            match = _CACHE_HASH_RE.search(f.read(_CACHE_HEAD_BYTES))
+    except OSError:
+        return None
+    return match.group(1).decode('ascii') if match else None
+
 
 # ---------------------------------------------------------------------------
 # Compiler-internal symbol filtering
@@ -94,10 +206,9 @@ def keep_function_name(name: str) -> bool:
     return not is_compiler_internal(name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a symbol extracted from an ELF file."""
-    __slots__ = ['name', 'address', 'size', 'symbol_type', 'binding', 'section']
     name: str
     address: int
     size: int
@@ -110,10 +221,9 @@ class Symbol:
                 f"bindings={self.binding}, addr=0x{self.address:08x}, size = {self.size})")
 
 
-@dataclass
+@dataclass(slots=True)
 class Function:
     """Represents a function extracted from an ELF file."""
-    __slots__ = ['name', 'address', 'size', 'parameters', 'return_type']
     name: str
     address: int
     size: int
@@ -138,6 +248,312 @@ class Function:
         return f"Function(name='{self.name}', params=[{params}], addr=0x{self.address:08x}, size={self.size})"
 
 
+class SymbolTable(collections.abc.Sequence):
+    """Column-oriented, read-mostly store for the in-memory symbol list.
+
+    Addresses and sizes live in ``array('Q')`` columns; symbol_type, binding
+    and section — a handful of distinct strings per ELF — are stored as ids
+    into one shared label list. Names are kept as undecoded UTF-8 in a single
+    byte heap and only decoded when read. A ``Symbol`` is only materialised
+    when an entry is indexed or iterated, so a 100k-symbol ELF costs a few
+    flat buffers instead of 100k objects and name strings. Materialised
+    symbols are copies: mutate the table, not the returned object.
+    """
+    __slots__ = ('_name_heap', '_name_starts', 'addresses', 'sizes', 'type_ids',
+                 'binding_ids', 'section_ids', '_labels', '_label_ids')
+
+    def __init__(self, symbols=()):
+        self._name_heap = bytearray()
+        self._name_starts = array('Q', [0])  # name i is heap[starts[i]:starts[i+1]]
+        self.addresses = array('Q')
+        self.sizes = array('Q')
+        self.type_ids = array('I')
+        self.binding_ids = array('I')
+        self.section_ids = array('I')
+        self._labels: List[str] = []
+        self._label_ids: Dict[str, int] = {}
+        self.extend(symbols)
+
+    @classmethod
+    def from_records(cls, records) -> "SymbolTable":
+        """Build from ``(raw_name, address, size, type, binding, section)``
+        tuples without decoding the names (see ELFParser._iter_symbol_records)."""
+        table = cls()
+        for record in records:
+            table.append_raw(*record)
+        return table
+
+    def _label_id(self, label: str) -> int:
+        lid = self._label_ids.get(label)
+        if lid is None:
+            if isinstance(label, str):
+                label = sys.intern(label)
+            lid = self._label_ids[label] = len(self._labels)
+            self._labels.append(label)
+        return lid
+
+    def append_raw(self, raw_name: bytes, address: int, size: int,
+                   symbol_type: str, binding: str, section: str) -> None:
+        self._name_heap += raw_name
+        self._name_starts.append(len(self._name_heap))
+        self.addresses.append(address)
+        self.sizes.append(size)
+        self.type_ids.append(self._label_id(symbol_type))
+        self.binding_ids.append(self._label_id(binding))
+        self.section_ids.append(self._label_id(section))
+
+    def append(self, sym: Symbol) -> None:
+        self.append_raw(sym.name.encode('utf-8', errors='surrogatepass'), sym.address,
+                        sym.size, sym.symbol_type, sym.binding, sym.section)
+
+    def extend(self, symbols) -> None:
+        for sym in symbols:
+            self.append(sym)
+
+    def label(self, label_id: int) -> str:
+        return self._labels[label_id]
+
+    def name(self, i: int) -> str:
+        starts = self._name_starts
+        return self._name_heap[starts[i]:starts[i + 1]].decode('utf-8', errors='replace')
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        address = self.addresses[i]  # raises IndexError for us
+        if i < 0:
+            i += len(self)
+        labels = self._labels
+        return Symbol(self.name(i), address, self.sizes[i],
+                      labels[self.type_ids[i]], labels[self.binding_ids[i]],
+                      labels[self.section_ids[i]])
+
+    def __iter__(self):
+        labels = self._labels
+        heap = self._name_heap
+        starts = self._name_starts
+        for k, (addr, size, t, b, sec) in enumerate(zip(self.addresses, self.sizes,
+                                                        self.type_ids, self.binding_ids,
+                                                        self.section_ids)):
+            yield Symbol(heap[starts[k]:starts[k + 1]].decode('utf-8', errors='replace'),
+                         addr, size, labels[t], labels[b], labels[sec])
+
+    def iter_dicts(self):
+        """Yield each row as the dict ``asdict(symbol)`` would give, straight
+        from the columns without building a Symbol."""
+        labels = self._labels
+        heap = self._name_heap
+        starts = self._name_starts
+        for k, (addr, size, t, b, sec) in enumerate(zip(self.addresses, self.sizes,
+                                                        self.type_ids, self.binding_ids,
+                                                        self.section_ids)):
+            yield {'name': heap[starts[k]:starts[k + 1]].decode('utf-8', errors='replace'),
+                   'address': addr, 'size': size, 'symbol_type': labels[t],
+                   'binding': labels[b], 'section': labels[sec]}
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"SymbolTable({len(self)} symbols)"
+
+
+# ---------------------------------------------------------------------------
+# Parallel DWARF extraction
+# ---------------------------------------------------------------------------
+# pyelftools decodes DWARF in pure Python, so on a large firmware ELF the CU walk
+# is a single GIL-bound loop that can run for tens of minutes. Compilation units
+# are independent, so the per-CU harvest (function parameters + file-scope
+# globals) fans out over worker processes. Each worker re-opens the ELF by path
+# and returns plain tuples only — DIE/CU objects do not survive pickling.
+#
+# Below DWARF_PARALLEL_MIN_CUS the process start-up cost outweighs the win and
+# the serial walk is used. ARCH_DWARF_WORKERS overrides the worker count; a value
+# of 1 (or less) disables the parallel path entirely.
+#
+# Every worker holds its own copy of the ELF plus its decoded DWARF sections, so
+# peak memory grows with the worker count times the ELF size. The default is
+# capped at DWARF_MAX_WORKERS for that reason; ARCH_DWARF_WORKERS can raise it on
+# a machine with the RAM to spare.
+DWARF_PARALLEL_MIN_CUS = 32
+DWARF_MAX_WORKERS = 8
+
+
+# A branch operand that is a bare immediate, as Capstone prints it without
+# detail mode ("0x8000", "#0x8000", "#-0x10", "12"). Register and memory operands
+# ("r3", "qword ptr [rip + 0x2f]") deliberately do not match.
+_IMM_OPERAND_RE = re.compile(r'#?(-?(?:0x[0-9a-fA-F]+|\d+))')
+
+# Direct-call mnemonics across the supported targets (CALLA/FCALL: TriCore).
+# Capstone reports mnemonics in lower case, so they are matched as-is.
+_CALL_MNEMONICS = frozenset(('call', 'bl', 'blx', 'jal', 'jalr', 'jl', 'calla', 'fcall'))
+
+# Scopes worth descending into when walking a CU for types, subprograms and
+# globals. Everything else — above all subprogram bodies (locals, lexical blocks,
+# inlined calls), which make up most of a CU — is stepped over via DW_AT_sibling.
+_DWARF_SCOPE_TAGS = frozenset(('DW_TAG_namespace',))
+_STRUCT_TAGS = ('DW_TAG_structure_type', 'DW_TAG_class_type', 'DW_TAG_union_type')
+# Type DIEs a typedef is followed through on its way to a struct.
+_TYPE_LINK_TAGS = frozenset(('DW_TAG_const_type', 'DW_TAG_volatile_type', 'DW_TAG_typedef'))
+
+# Reference forms whose value is relative to the owning CU's header.
+_CU_REF_FORMS = frozenset((
+    'DW_FORM_ref1', 'DW_FORM_ref2', 'DW_FORM_ref4',
+    'DW_FORM_ref8', 'DW_FORM_ref_udata',
+))
+
+
+def _attr_ref_offset(die, attribute_name: str) -> Optional[int]:
+    """Absolute .debug_info offset a reference attribute points at, or None."""
+    attr = die.attributes.get(attribute_name)
+    if attr is None:
+        return None
+    if attr.form in _CU_REF_FORMS:
+        return attr.value + die.cu.cu_offset
+    return attr.value
+
+
+def _iter_declaration_DIEs(die, depth: int = 1):
+    """Yield ``(DIE, depth)`` for the declarations under ``die`` (a CU's top DIE).
+
+    Only namespace scopes are descended into. pyelftools' iter_children follows
+    DW_AT_sibling, so a function's subtree is skipped without being decoded —
+    the parameters of a subprogram are read on demand from its direct children.
+    Function-local types are therefore not harvested; they cannot be the type of
+    a global or of a parameter anyway.
+    """
+    for child in die.iter_children():
+        yield child, depth
+        if child.tag in _DWARF_SCOPE_TAGS:
+            yield from _iter_declaration_DIEs(child, depth + 1)
+
+
+def _search_index(names: List[str]) -> tuple:
+    """``(blob, starts)`` for _substring_indices: every name lowercased into
+    one newline-joined buffer, and the offset each name starts at. ``blob``
+    is None when lower() changed some name's length (rare non-ASCII), since
+    the offsets would no longer line up."""
+    starts, pos = [], 0
+    for name in names:
+        starts.append(pos)
+        pos += len(name) + 1
+    blob = "\n".join(names).lower()
+    return (blob if len(blob) == max(pos - 1, 0) else None), starts
+
+
+def _iter_substring_indices(index: tuple, needle: str, names) -> Generator[int, None, None]:
+    """Positions of the names containing ``needle`` (already lowercased), in order.
+
+    A query is a run of C-level ``str.find`` calls over the shared buffer
+    instead of a ``.lower()`` and an ``in`` test per name. ``names`` (the
+    same names, in order; any iterable) is only scanned when the buffer
+    cannot answer: an unusable blob or a needle spanning the separator.
+    Lazy, so a caller that stops after the first few hits never scans the rest.
+    """
+    blob, starts = index
+    if blob is None or "\n" in needle:
+        yield from (i for i, name in enumerate(names) if needle in name.lower())
+        return
+    if not starts:
+        return
+    pos = blob.find(needle)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        yield i
+        if i + 1 >= len(starts):
+            break
+        pos = blob.find(needle, starts[i + 1])
+
+
+def _substring_indices(index: tuple, needle: str, names) -> List[int]:
+    """All of _iter_substring_indices as a list."""
+    return list(_iter_substring_indices(index, needle, names))
+
+
+def _gil_enabled() -> bool:
+    """False only on a free-threaded (PEP 703) interpreter running without the GIL."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return check() if check else True
+
+
+def _dwarf_worker_count() -> int:
+    """Number of worker processes for the parallel DWARF walk (at least 1).
+
+    Defaults to the CPU count capped at DWARF_MAX_WORKERS, since each worker
+    loads its own copy of the ELF; ARCH_DWARF_WORKERS overrides the cap.
+    """
+    override = os.environ.get("ARCH_DWARF_WORKERS")
+    if override:
+        try:
+            return max(int(override), 1)
+        except ValueError:
+            logger.warning("Ignoring invalid ARCH_DWARF_WORKERS=%r", override)
+    return min(os.cpu_count() or 1, DWARF_MAX_WORKERS)
+
+
+def _parse_cu_range(elf_path: str, cu_offsets: List[int], structures: bool = False) -> list:
+    """Process-pool worker: harvest parameters, globals and (optionally)
+    structures for a set of CUs.
+
+    Returns one ``(cu_offset, vars, params, structs, typedefs)`` tuple per CU,
+    each list in DIE order: ``[(var_name, type)]``, ``[(func_name, params)]``,
+    ``[(struct_name, fields)]`` and ``[(typedef_name, resolved)]`` with
+    ``resolved`` as returned by ELFParser._resolve_typedef — picklable scalars only.
+    """
+    parser = ELFParser(elf_path)
+    parser.stream = parser._open_elf_stream()
+    parser._load_elf_file()
+    dwarfinfo = parser.elf_file.get_dwarf_info()
+    results = []
+    links, resolved_at = {}, {}
+    try:
+        for cu_offset in cu_offsets:
+            CU = dwarfinfo.get_CU_at(cu_offset)
+            cu_vars = []
+            cu_params = []
+            cu_structs = []
+            cu_typedefs = []
+            typedef_offsets = []
+            for DIE, depth in _iter_declaration_DIEs(CU.get_top_DIE()):
+                tag = DIE.tag
+                try:
+                    if structures and tag in _STRUCT_TAGS:
+                        entry = parser._struct_entry(DIE)
+                        if entry:
+                            cu_structs.append(entry)
+                        parser._note_type_DIE(DIE, links, resolved_at, entry[1] if entry else None)
+                        continue
+                    if structures:
+                        parser._note_type_DIE(DIE, links, resolved_at)
+                    if 'DW_AT_name' not in DIE.attributes:
+                        continue
+                    if tag == 'DW_TAG_variable' and depth == 1:
+                        name = parser._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                        cu_vars.append((name, parser._type_name_of(DIE) or "unknown"))
+                    elif tag == 'DW_TAG_subprogram':
+                        func_name = parser._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                        cu_params.append((func_name, parser._collect_parameters(DIE)))
+                    elif structures and tag == 'DW_TAG_typedef' and DIE.offset in links:
+                        td_name = parser._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                        typedef_offsets.append((td_name, DIE.offset))
+                except Exception:
+                    continue
+            # Resolved once the whole CU is walked, so forward references hit.
+            for td_name, td_offset in typedef_offsets:
+                resolved = parser._resolve_typedef_at(dwarfinfo, td_offset, links, resolved_at)
+                if resolved:
+                    cu_typedefs.append((td_name, resolved))
+            results.append((cu_offset, cu_vars, cu_params, cu_structs, cu_typedefs))
+    finally:
+        parser.close()
+    return results
+
+
 class ELFParser:
     """
     Parser for ELF binary files to extract symbols and functions.
@@ -150,14 +566,38 @@ class ELFParser:
         self.elf_path = Path(elf_path) if elf_path else None
         self.stream = None
         self.elf_file = None
-        self.symbols: List[Symbol] = []
+        self.symbols: Union[List[Symbol], SymbolTable] = []
         self.functions: List[Function] = []
         self.structures: Dict[str, List[Dict[str, str]]] = {}
         self.global_vars_dwarf: Dict[str, str] = {}
 
         self._func_addr_map: Dict[int, Function] = {}
         self._sorted_func_addrs: List[int] = []
+        self._sorted_funcs: List[Function] = []  # parallel to _sorted_func_addrs
+        # Lazy lookup indices, see _function_name_index/_symbol_address_index
+        self._func_by_name: Dict[str, List[Function]] = {}
+        self._func_by_name_src: Optional[List[Function]] = None
+        self._func_by_name_len = 0
+        self._func_search_index: Optional[tuple] = None  # see _search_index
+        self._sym_by_addr: Dict[int, int] = {}
+        self._sym_by_addr_src: Optional[List[Symbol]] = None
+        self._sym_by_addr_len = 0
+        self._param_cache: Dict[tuple, List[Dict[str, str]]] = {}  # see get_parameters_for
+        # True once self.functions carry their DWARF parameters (a walk, the
+        # cache or the native parser), empty lists included.
+        self._params_harvested = False
+        self._type_names: Dict[int, str] = {}  # see _type_name_of
+        self._type_pool: Dict[str, str] = {}
+        self._dwarf_strs: Dict[bytes, str] = {}  # see _dwarf_str
+        self._cs_cache: Dict[int, "Cs"] = {}  # see _get_capstone_instance
+        self._dwarfinfo = None  # see _get_dwarf_info
+        self._sections = None  # see _get_sections
+        self._symbol_tables = None
+        self._exec_sections = None  # see _get_exec_sections
+        self._sym_parser = None  # see _load_elf_file
         self._machine_arch: Optional[str] = None
+        self._addr_mask = -1  # see _normalize_address
+        self._cs_mode_mask = 0  # see _get_capstone_instance
         self.md5_hash = None
         self.parser_backend = "pyelftools"
 
@@ -189,15 +629,15 @@ class ELFParser:
                 self.parser_backend = "rust_elf_parser"
                 return
             except Exception as e:
-                logger.warning(f"Native MD5 compute failed: {e}. Falling back to Python backend.")
+                logger.warning("Native MD5 compute failed: %s. Falling back to Python backend.", e)
                 self.parser_backend = "pyelftools"
 
         try:
             # Read the whole file into memory ONCE, then both hash it and parse
             # it from that in-memory buffer.
-            with open(self.elf_path, 'rb') as f:
-                data = f.read()
-            self.md5_hash = hashlib.md5(data).hexdigest()
+            self.stream = self._open_elf_stream()
+            with self.stream.getbuffer() as view:
+                self.md5_hash = hashlib.md5(view).hexdigest()
         except Exception as e:
             if getattr(self, 'test_mode', False):
                 self.md5_hash = "DUMMY_HASH_FOR_TEST_MODE"
@@ -208,7 +648,6 @@ class ELFParser:
             raise e
 
         try:
-            self.stream = io.BytesIO(data)
             self._load_elf_file()
         except Exception as e:
             self.close()
@@ -239,7 +678,18 @@ class ELFParser:
         self.global_vars_dwarf = {}
         self._func_addr_map = {}
         self._sorted_func_addrs = []
-        gc.collect()
+        self._sorted_funcs = []
+        self._func_by_name, self._func_by_name_src = {}, None
+        self._func_search_index = None
+        self._sym_by_addr, self._sym_by_addr_src = {}, None
+        self._param_cache = {}
+        self._params_harvested = False
+        self._type_names = {}
+        self._type_pool = {}
+        self._dwarf_strs = {}
+        self._cs_cache = {}
+        self._dwarfinfo = None
+        self._sections = self._symbol_tables = self._exec_sections = None
 
     def _calculate_md5(self):
         """Calculates MD5 hash of the ELF file."""
@@ -247,10 +697,17 @@ class ELFParser:
         # intercepted syscall, so a small chunk size turned a 50 MB hash into
         # thousands of scanned reads. Kept for any caller outside load_elf, which
         # now hashes the already-in-memory buffer directly.
+        # The digest stays MD5: it is the elf_hash key stored in every project
+        # and the one rust_elf_parser.compute_md5 produces, so a faster algorithm
+        # would orphan all previously imported ELF data.
         hash_md5 = hashlib.md5()
-        with open(self.elf_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4 * 1024 * 1024), b""):
-                hash_md5.update(chunk)
+        # One reused buffer filled with readinto(): no fresh 4 MB bytes object
+        # per chunk. hashlib releases the GIL while digesting each chunk.
+        buf = bytearray(4 * 1024 * 1024)
+        view = memoryview(buf)
+        with open(self.elf_path, "rb", buffering=0) as f:
+            while n := f.readinto(buf):
+                hash_md5.update(view[:n])
         return hash_md5.hexdigest()
 
     def _open_elf_stream(self) -> "io.BytesIO":
@@ -260,6 +717,10 @@ class ELFParser:
         the file once into a BytesIO means all subsequent seeks/reads hit RAM
         instead of an OS file handle — see load_elf for why that matters on
         endpoint-security machines.
+
+        Deliberately not an mmap: a live mapping keeps the ELF locked on Windows
+        (the user's next link step fails to overwrite it) and faults the whole
+        process if a network share drops mid-walk.
         """
         with open(self.elf_path, 'rb') as f:
             return io.BytesIO(f.read())
@@ -269,57 +730,58 @@ class ELFParser:
         try:
             self.stream.seek(0)
             self.elf_file = ELFFile(self.stream)
+            self._dwarfinfo = None
+            self._type_names = {}
+            self._type_pool = {}
+            self._dwarf_strs = {}
+            self._cs_cache = {}
+            self._sections = self._symbol_tables = self._exec_sections = None
             if not self.elf_file:
                 raise ValueError(f"Invalid ELF file: {self.elf_path}")
+            self._sym_parser = _SYM_PARSERS[(self.elf_file.elfclass, self.elf_file.little_endian)]
             self._machine_arch = self.elf_file.get_machine_arch()
-            logger.info(f"Successfully loaded ELF file: {self.elf_path}")
-            logger.info(f"ELF Architecture {self._machine_arch}")
+            # ARM code addresses carry the Thumb bit; everything else is used as-is.
+            self._addr_mask = ~1 if self._machine_arch == 'ARM' else -1
+            self._cs_mode_mask = 1 if self._machine_arch == 'ARM' else 0
+            logger.info("Successfully loaded ELF file: %s", self.elf_path)
+            logger.info("ELF Architecture %s", self._machine_arch)
         except Exception as e:
             if getattr(self, 'test_mode', False):
                 return
             raise ValueError(f"Failed to load ELF file: {e}") from e
 
-    def save_cache(self, cache_path: str):
-        """Saves parsed data to a JSON cache file."""
+    def save_cache(self, cache_path: str) -> bool:
+        """Saves parsed data to a JSON cache file. Returns False if it could not be written."""
         try:
-            # Convert objects to dicts for JSON serialization
-            # We do this generator-style to avoid creating a massive list of dicts in memory
-            
             os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            
-            with open(cache_path, 'w') as f:
-                # Manually construct JSON to stream data
-                f.write('{\n')
-                f.write(f'  "elf_path": "{str(self.elf_path)}",\n')
-                f.write(f'  "elf_hash": "{self.md5_hash}",\n')
-                
-                f.write('  "symbols": [\n')
-                for i, s in enumerate(self.symbols):
-                    json_str = json.dumps(asdict(s))
-                    f.write('    ' + json_str + (',' if i < len(self.symbols) - 1 else '') + '\n')
-                f.write('  ],\n')
 
-                f.write('  "functions": [\n')
-                for i, func in enumerate(self.functions):
-                    # Manual serialization for Function because of __slots__ and potential complexity
-                    func_dict = {
-                        'name': func.name,
-                        'address': func.address,
-                        'size': func.size,
-                        'parameters': func.parameters,
-                        'return_type': func.return_type
-                    }
-                    json_str = json.dumps(func_dict)
-                    f.write('    ' + json_str + (',' if i < len(self.functions) - 1 else '') + '\n')
-                f.write('  ],\n')
-
-                f.write(f'  "structures": {json.dumps(self.structures)},\n')
-                f.write(f'  "global_vars": {json.dumps(self.global_vars_dwarf)}\n')
-                f.write('}')
-                
-            logger.info(f"Cache saved to {cache_path}")
+            if isinstance(self.symbols, SymbolTable):
+                symbols = self.symbols.iter_dicts()
+            else:
+                symbols = (asdict(s) for s in self.symbols)
+            # Function is a slots class with a custom __init__; spell the fields out.
+            functions = ({'name': func.name, 'address': func.address, 'size': func.size,
+                          'parameters': func.parameters, 'return_type': func.return_type}
+                         for func in self.functions)
+
+            # Streamed section by section, the symbol and function arrays in
+            # batches, so no full list of dicts is ever held in memory.
+            with open(cache_path, 'wb') as f:
+                f.write(b'{\n  "elf_path": ' + _json_bytes(str(self.elf_path)))
+                f.write(b',\n  "elf_hash": ' + _json_bytes(self.md5_hash))
+                f.write(b',\n  "symbols": ')
+                _write_json_array(f, symbols)
+                f.write(b',\n  "functions": ')
+                _write_json_array(f, functions)
+                f.write(b',\n  "structures": ' + _json_bytes(self.structures))
+                f.write(b',\n  "global_vars": ' + _json_bytes(self.global_vars_dwarf))
+                f.write(b'\n}')
+
+            logger.info("Cache saved to %s", cache_path)
+            return True
         except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            logger.error("Failed to save cache: %s", e)
+            return False
 
     def load_cache(self, cache_path: str) -> bool:
         """Loads parsed data from a JSON cache file."""
@@ -327,8 +789,8 @@ class ELFParser:
             return False
             
         try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                data = _json_loads(f.read())
             
             if "database" in data:
                 data = data["database"]
@@ -340,8 +802,14 @@ class ELFParser:
             self.symbols = []
             self.functions = []
             
-            self.symbols = [Symbol(**s) for s in data["symbols"]]
-            self.functions = [Function(**f) for f in data["functions"]
+            # Rows go straight into the table columns; no Symbol is built per row.
+            self.symbols = SymbolTable.from_records(
+                (s["name"].encode('utf-8', errors='surrogatepass'), s["address"], s["size"],
+                 s["symbol_type"], s["binding"], s["section"])
+                for s in data["symbols"])
+            self.functions = [Function(f["name"], f["address"], f["size"],
+                                       f["parameters"], f.get("return_type"))
+                              for f in data["functions"]
                               if keep_function_name(f.get("name", ""))]
             self.structures = data["structures"]
             self.global_vars_dwarf = data["global_vars"]
@@ -352,24 +820,35 @@ class ELFParser:
                     self.stream = self._open_elf_stream()
                     self._load_elf_file()
                 except Exception as e:
-                    logger.warning(f"Could not open original ELF file {self.elf_path}: {e}. Disassembly will not work.")
+                    logger.warning("Could not open original ELF file %s: %s. Disassembly will not work.", self.elf_path, e)
             
             self._build_function_address_map()
+            self._params_harvested = True
             logger.info("Loaded data from cache.")
             return True
         except Exception as e:
-            logger.warning(f"Failed to load cache: {e}")
+            logger.warning("Failed to load cache: %s", e)
             return False
 
     def _normalize_address(self, address: int) -> int:
-        """Normalizes an address for lookup, e.g., removing Thumb bit for ARM."""
-        arch = self._machine_arch
-        if not arch and self.elf_file:
-            arch = self.elf_file.get_machine_arch()
-            self._machine_arch = arch
-        if arch == 'ARM':
-            return address & ~1
-        return address
+        """Normalizes an address for lookup, e.g., removing Thumb bit for ARM.
+
+        The mask is fixed when the ELF is loaded, so this is a single AND.
+        """
+        return address & self._addr_mask
+
+    def _get_sections(self) -> list:
+        """Section objects of the open ELF, decoded from the section header
+        table once and reused by every later pass."""
+        if self._sections is None:
+            self._sections = list(self.elf_file.iter_sections())
+            self._symbol_tables = [sec for sec in self._sections
+                                   if isinstance(sec, SymbolTableSection)]
+        return self._sections
+
+    def _get_symbol_tables(self) -> list:
+        self._get_sections()
+        return self._symbol_tables
 
     def _ensure_elf_file_open(self) -> bool:
         """Reopen the ELF lazily for operations that need section bytes/disassembly."""
@@ -386,8 +865,61 @@ class ELFParser:
         if not self.functions and not self.symbols:
              return
 
-        self._func_addr_map = {self._normalize_address(f.address): f for f in self.functions}
-        self._sorted_func_addrs = sorted(self._func_addr_map.keys())
+        self._set_function_address_map(
+            {self._normalize_address(f.address): f for f in self.functions})
+
+    def _set_function_address_map(self, addr_map: Dict[int, Function]) -> None:
+        """Install ``addr_map`` plus its sorted address/function columns.
+
+        The columns stay plain lists: bisect on a list compares the int objects
+        already held as dict keys, whereas a packed array would box a fresh int
+        on every probe and save no memory.
+        """
+        self._func_addr_map = addr_map
+        items = sorted(addr_map.items())
+        self._sorted_func_addrs = [a for a, _ in items]
+        self._sorted_funcs = [f for _, f in items]
+
+    def _function_name_index(self) -> Dict[str, List[Function]]:
+        """name -> functions (statics may repeat across CUs). Rebuilt lazily
+        whenever ``self.functions`` is replaced or grows."""
+        src = self.functions
+        if self._func_by_name_src is not src or self._func_by_name_len != len(src):
+            index: Dict[str, List[Function]] = {}
+            for f in src:
+                index.setdefault(f.name, []).append(f)
+            self._func_by_name = index
+            self._func_by_name_src = src
+            self._func_by_name_len = len(src)
+            self._func_search_index = None
+        return self._func_by_name
+
+    def _function_substring_matches(self, needle: str) -> List[Function]:
+        """Functions whose lowercased name contains ``needle`` (already
+        lowercased), in list order; see _substring_indices."""
+        self._function_name_index()  # drops a stale index
+        functions = self.functions
+        if self._func_search_index is None:
+            self._func_search_index = _search_index([f.name for f in functions])
+        return [functions[i] for i in
+                _substring_indices(self._func_search_index, needle, (f.name for f in functions))]
+
+    def _symbol_address_index(self) -> Dict[int, int]:
+        """address -> row of the first symbol at that address, same
+        invalidation as above.
+
+        Built from the address column alone, so no Symbol is materialised until
+        a lookup actually hits.
+        """
+        src = self.symbols
+        if self._sym_by_addr_src is not src or self._sym_by_addr_len != len(src):
+            addrs = src.addresses if isinstance(src, SymbolTable) else [s.address for s in src]
+            n = len(addrs)
+            # Walk the rows backwards so the first symbol at an address wins.
+            self._sym_by_addr = dict(zip(reversed(addrs), range(n - 1, -1, -1)))
+            self._sym_by_addr_src = src
+            self._sym_by_addr_len = n
+        return self._sym_by_addr
 
     def extract_all(self):
         """Runs all extraction methods."""
@@ -395,20 +927,22 @@ class ELFParser:
             if self._try_native_extract():
                 return
 
-        # Consume generators into lists for storage
         if not self.symbols:
-            self.symbols = list(self._generate_symbols())
-        
-        if not self.functions:
+            self._extract_symbols_and_functions()
+        elif not self.functions:
             self.functions = list(self._generate_functions())
             
-        self.extract_function_parameters()
-        self.extract_structures()
-        self.extract_dwarf_variables()
+        want_structures = not self.structures
+        parallel = self._extract_dwarf_parallel(structures=want_structures)
+        if self.elf_file and self.elf_file.has_dwarf_info():
+            # One serial DWARF walk for whatever the parallel pass did not cover.
+            self._walk_dwarf(params=not parallel,
+                             variables=not parallel and not self.global_vars_dwarf,
+                             structures=not parallel and want_structures)
+            # The DIE cache is only worth keeping for lazy per-query lookups.
+            self._dwarfinfo = None
+            self._dwarf_strs = {}
         self._build_function_address_map()
-        
-        # Force GC
-        gc.collect()
 
     def _try_native_extract(self) -> bool:
         if not RUST_PARSER_AVAILABLE:
@@ -419,31 +953,29 @@ class ELFParser:
             self._map_native_json(data)
             return True
         except Exception as e:
-            logger.warning(f"Native extraction failed: {e}. Falling back to Python parser.")
+            logger.warning("Native extraction failed: %s. Falling back to Python parser.", e)
             self.parser_backend = "pyelftools"
             try:
-                with open(self.elf_path, 'rb') as f:
-                    raw_data = f.read()
-                self.stream = io.BytesIO(raw_data)
+                self.stream = self._open_elf_stream()
                 self._load_elf_file()
             except Exception as e2:
-                logger.error(f"Failed to open ELF file for fallback parser: {e2}")
+                logger.error("Failed to open ELF file for fallback parser: %s", e2)
             return False
 
     def _map_native_json(self, data: dict):
         self.md5_hash = data.get("elf_hash", self.md5_hash)
         
-        self.symbols = []
-        for s in data.get("symbols", []):
-            self.symbols.append(Symbol(
-                name=s["name"],
-                address=s["address"],
-                size=s["size"],
-                symbol_type=s["symbol_type"],
-                binding=s["binding"],
-                section=s["section"]
-            ))
-            
+        # SymbolTable keeps one interned copy of each type/binding/section label
+        # instead of a fresh str per JSON record.
+        self.symbols = SymbolTable(Symbol(
+            name=s["name"],
+            address=s["address"],
+            size=s["size"],
+            symbol_type=s["symbol_type"],
+            binding=s["binding"],
+            section=s["section"]
+        ) for s in data.get("symbols", []))
+
         self.functions = []
         for f in data.get("functions", []):
             if not keep_function_name(f.get("name", "")):
@@ -456,50 +988,131 @@ class ELFParser:
                 return_type=f.get("return_type")
             ))
             
+        self._params_harvested = True
         self.structures = data.get("structures", {})
         self.global_vars_dwarf = data.get("global_vars", {})
         
         self._build_function_address_map()
 
-    def _generate_symbols(self) -> Generator[Symbol, None, None]:
-        """Generator that yields symbols one by one."""
+    def _iter_symbol_records(self, kinds: Optional[Set[str]] = None):
+        """Yield ``(raw_name, address, size, type, binding, section)`` for every
+        named symbol, with the name still as undecoded UTF-8 bytes.
+
+        ``kinds`` restricts output to those STT_* types; the type is checked
+        before anything else is sliced or built.
+        """
         if not self.elf_file:
             return
         logger.info("Extracting symbols from ELF file")
-        elffile = self.elf_file
-        for section in elffile.iter_sections():
-            if isinstance(section, SymbolTableSection):
-                for symbol in section.iter_symbols():
-                    if not symbol.name: continue
-                    if symbol['st_shndx'] == 'SHN_UNDEF': section_name = 'UNDEF'
-                    elif symbol['st_shndx'] == 'SHN_ABS': section_name = 'ABS'
-                    else:
-                        try: section_name = elffile.get_section(symbol['st_shndx']).name
-                        except: section_name = 'UNKNOWN'
-                    
-                    yield Symbol(
-                        name=symbol.name, address=symbol['st_value'], size=symbol['st_size'],
-                        symbol_type=symbol['st_info']['type'], binding=symbol['st_info']['bind'],
-                        section=section_name
-                    )
-
-    def extract_symbols(self):
-        """Public method to populate symbols list."""
+        # Decode the section header table once: get_section() re-parses a header
+        # per call, which made the symbol loop O(N_sym * N_sec).
+        sections = self._get_sections()
+        # Reserved indices (SHN_COMMON, SHN_XINDEX, ...) other than UNDEF/ABS
+        # resolve to 'UNKNOWN'.
+        shndx_to_name = {i: sys.intern(sec.name) for i, sec in enumerate(sections[:_SHN_LORESERVE])}
+        shndx_to_name[0] = 'UNDEF'
+        shndx_to_name[_SHN_ABS] = 'ABS'
+        # Table bytes are read up front on this thread: the tables share one
+        # stream, so only the decode below may run concurrently.
+        tables = [(sec, sec.data(), sec.stringtable.data())
+                  for sec in self._get_symbol_tables()]
+        if len(tables) > 1 and not _gil_enabled():
+            # Free-threaded interpreter: .symtab and .dynsym decode in parallel.
+            with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+                for records in pool.map(
+                        lambda t: list(self._decode_symbol_table(*t, kinds, shndx_to_name)),
+                        tables):
+                    yield from records
+        else:
+            for table in tables:
+                yield from self._decode_symbol_table(*table, kinds, shndx_to_name)
+
+    def _decode_symbol_table(self, section, data: bytes, strtab: bytes,
+                             kinds: Optional[Set[str]], shndx_to_name: Dict[int, str]):
+        """Record generator for one symbol table (see _iter_symbol_records)."""
+        for st_name, value, size, info, shndx in self._iter_raw_symbols(section, data):
+            sym_type = _STT_NAMES.get(info & 0xf, info & 0xf)
+            if kinds is not None and sym_type not in kinds: continue
+            end = strtab.find(b'\x00', st_name)
+            if end <= st_name: continue  # unnamed (or unterminated) entry
+            yield (strtab[st_name:end], value, size, sym_type,
+                   _STB_NAMES.get(info >> 4, info >> 4),
+                   shndx_to_name.get(shndx, 'UNKNOWN'))
+
+    def _generate_symbols(self, kinds: Optional[Set[str]] = None) -> Generator[Symbol, None, None]:
+        """Generator that yields symbols one by one (see _iter_symbol_records)."""
+        for raw_name, value, size, sym_type, binding, section in self._iter_symbol_records(kinds):
+            yield Symbol(raw_name.decode('utf-8', errors='replace'), value, size,
+                         sym_type, binding, section)
+
+    def _iter_raw_symbols(self, section, data: Optional[bytes] = None):
+        """Yield ``(st_name, st_value, st_size, st_info, st_shndx)`` for every
+        entry of a symbol table, unpacked straight from the section bytes
+        (``data``, read from the section when not given)."""
+        if data is None:
+            data = section.data()
+        return self._sym_parser(data, section['sh_entsize'])
+
+    def iter_symbols(self, kinds: Optional[Set[str]] = None) -> Generator[Symbol, None, None]:
+        """Yield symbols without caching them: the already-extracted list when
+        there is one, otherwise straight off the symbol tables."""
+        if self.symbols:
+            if kinds is None:
+                yield from self.symbols
+            else:
+                yield from (s for s in self.symbols if s.symbol_type in kinds)
+        else:
+            yield from self._generate_symbols(kinds)
+
+    def extract_symbols(self, kinds: Optional[Set[str]] = None):
+        """Public method to populate symbols list.
+
+        With ``kinds`` (e.g. ``{'STT_FUNC', 'STT_OBJECT'}``) only those types
+        are returned and ``self.symbols`` is left as-is, so a partial table
+        never masquerades as the full one.
+        """
+        if kinds is not None:
+            if self.symbols:
+                return SymbolTable(self.iter_symbols(kinds))
+            return SymbolTable.from_records(self._iter_symbol_records(kinds))
         if self.symbols: return self.symbols
         if RUST_PARSER_AVAILABLE and self.parser_backend == "rust_elf_parser":
             if self._try_native_extract():
                 return self.symbols
-        self.symbols = list(self._generate_symbols())
+        # The function list falls out of the same scan, so a following
+        # extract_functions() returns without walking the table again.
+        self._extract_symbols_and_functions()
         return self.symbols
 
+    def _extract_symbols_and_functions(self) -> None:
+        """Populate ``self.symbols`` and, unless already set, ``self.functions``
+        from a single scan of the symbol tables.
+
+        STT_FUNC records are bucketed into Functions as they stream past, so
+        the function list never costs a second walk over the symbol table.
+        """
+        table = SymbolTable()
+        functions = []
+        append_raw = table.append_raw
+        for raw_name, value, size, sym_type, binding, section in self._iter_symbol_records():
+            append_raw(raw_name, value, size, sym_type, binding, section)
+            if sym_type == 'STT_FUNC':
+                name = raw_name.decode('utf-8', errors='replace')
+                if keep_function_name(name):
+                    functions.append(Function(name=name, address=value, size=size, parameters=[]))
+        self.symbols = table
+        if not self.functions:
+            self.functions = functions
+
     def _generate_functions(self) -> Generator[Function, None, None]:
-        """Generator that yields functions one by one."""
-        if not self.symbols:
-            self.symbols = list(self._generate_symbols())
-            
+        """Generator that yields functions one by one.
+
+        Filters the symbol stream on the fly, so a caller that only wants
+        functions never pins the full Symbol list in memory.
+        """
         logger.info("Filtering function symbols...")
-        for symbol in self.symbols:
-            if symbol.symbol_type == 'STT_FUNC' and keep_function_name(symbol.name):
+        for symbol in self.iter_symbols(kinds={'STT_FUNC'}):
+            if keep_function_name(symbol.name):
                 yield Function(
                     name=symbol.name, address=symbol.address, size=symbol.size, parameters=[]
                 )
@@ -514,58 +1127,219 @@ class ELFParser:
         return self.functions
 
     def _get_die_from_attribute(self, die, attribute_name):
-        if attribute_name not in die.attributes: return None
-        attr = die.attributes[attribute_name]
-        offset = attr.value
-        if hasattr(attr, 'form') and attr.form in ('DW_FORM_ref1', 'DW_FORM_ref2', 'DW_FORM_ref4', 'DW_FORM_ref8', 'DW_FORM_ref_udata'):
-             offset += die.cu.cu_offset
+        offset = _attr_ref_offset(die, attribute_name)
+        if offset is None: return None
         try: return die.cu.dwarfinfo.get_DIE_from_refaddr(offset)
         except: return None
 
+    def _dwarf_str(self, raw: bytes) -> str:
+        """Decode a DWARF string attribute, one shared str per distinct value.
+
+        Type, member, parameter and typedef names repeat in every CU that
+        includes the same header; a cache hit skips the decode and the
+        harvested dicts end up holding a single copy of each name. The
+        streaming DB walk resets the cache per CU, since its harvest is
+        flushed as it goes.
+        """
+        text = self._dwarf_strs.get(raw)
+        if text is None:
+            text = self._dwarf_strs[raw] = raw.decode('utf-8', errors='replace')
+        return text
+
+    def _type_name_of(self, die) -> Optional[str]:
+        """Formatted name of ``die``'s DW_AT_type, or None if it has none.
+
+        Memoised by the referenced DIE's offset: base types, typedefs and
+        ``const T*`` chains repeat across every parameter and member, and a
+        cache hit skips both the DIE lookup and the recursive formatting.
+        Every CU carries its own copy of the same pointer/qualifier DIEs, so
+        the formatted names also go through ``_type_pool``: each distinct
+        spelling is one shared str across all fields and parameters (per CU in
+        the streaming DB walk, which resets both).
+        """
+        offset = _attr_ref_offset(die, 'DW_AT_type')
+        if offset is None: return None
+        name = self._type_names.get(offset)
+        if name is None:
+            try: type_die = die.cu.dwarfinfo.get_DIE_from_refaddr(offset)
+            except: return None
+            name = self._get_type_name(type_die)
+            name = self._type_names[offset] = self._type_pool.setdefault(name, name)
+        return name
+
     def _get_type_name(self, type_die) -> str:
         try:
             if not type_die: return "unknown"
             tag = type_die.tag
-            name = type_die.attributes['DW_AT_name'].value.decode('utf-8', errors='replace') if 'DW_AT_name' in type_die.attributes else None
+            name = self._dwarf_str(type_die.attributes['DW_AT_name'].value) if 'DW_AT_name' in type_die.attributes else None
             
             if tag == 'DW_TAG_base_type': return name or 'void'
             elif tag == 'DW_TAG_typedef': return name or 'typedef'
             elif tag == 'DW_TAG_structure_type': return f"struct {name}" if name else "struct <anon>"
             elif tag == 'DW_TAG_pointer_type':
-                inner = self._get_die_from_attribute(type_die, 'DW_AT_type')
-                return f"{self._get_type_name(inner)}*" if inner else "void*"
+                inner = self._type_name_of(type_die)
+                return f"{inner}*" if inner else "void*"
             elif tag == 'DW_TAG_const_type':
-                inner = self._get_die_from_attribute(type_die, 'DW_AT_type')
-                return f"const {self._get_type_name(inner)}" if inner else "const void"
+                inner = self._type_name_of(type_die)
+                return f"const {inner}" if inner else "const void"
             elif tag == 'DW_TAG_volatile_type':
-                inner = self._get_die_from_attribute(type_die, 'DW_AT_type')
-                return f"volatile {self._get_type_name(inner)}" if inner else "volatile void"
+                inner = self._type_name_of(type_die)
+                return f"volatile {inner}" if inner else "volatile void"
             elif tag == 'DW_TAG_array_type':
-                 inner = self._get_die_from_attribute(type_die, 'DW_AT_type')
-                 return f"{self._get_type_name(inner)}[]" if inner else "array"
+                 inner = self._type_name_of(type_die)
+                 return f"{inner}[]" if inner else "array"
             return name or "unknown"
         except: return "unknown"
 
     def extract_function_parameters(self) -> None:
         if not self.elf_file or not self.elf_file.has_dwarf_info(): return
-        dwarfinfo = self.elf_file.get_dwarf_info()
+        self._walk_dwarf(params=True)
+
+    def _collect_parameters(self, DIE) -> List[Dict[str, str]]:
+        """Formal parameters of a DW_TAG_subprogram DIE as ``{'name', 'type'}`` dicts."""
+        params = []
+        for child in DIE.iter_children():
+            if child.tag == 'DW_TAG_formal_parameter' and 'DW_AT_name' in child.attributes:
+                p_name = self._dwarf_str(child.attributes['DW_AT_name'].value)
+                p_type = self._type_name_of(child) or "unknown"
+                params.append({'name': p_name, 'type': p_type})
+        return params
+
+    @staticmethod
+    def _cu_covers(top_DIE, address: int) -> bool:
+        """True unless the CU's low/high_pc range provably excludes ``address``.
+
+        CUs described by DW_AT_ranges (or with no pc range at all) are never
+        ruled out, so a miss here only reorders the walk.
+        """
+        attrs = top_DIE.attributes
+        if 'DW_AT_low_pc' not in attrs or 'DW_AT_high_pc' not in attrs:
+            return True
+        low = attrs['DW_AT_low_pc'].value
+        high_attr = attrs['DW_AT_high_pc']
+        high = high_attr.value if high_attr.form == 'DW_FORM_addr' else low + high_attr.value
+        return low <= address < high
+
+    def get_parameters_for(self, func: Union[str, Function]) -> List[Dict[str, str]]:
+        """Parameters of one function, parsing DWARF only as far as needed.
+
+        ``func`` is a Function, or a name standing for the first function of
+        that name. Once parameters have been harvested (extract_all,
+        load_cache) they are returned as stored, empty lists included.
+        Otherwise CUs whose pc range holds the function's address are walked
+        first, stopping at the defining DW_TAG_subprogram whose low_pc is that
+        address, so two static functions sharing a name stay apart. Results
+        are memoised per (name, address).
+        """
+        if isinstance(func, Function):
+            name, known = func.name, func
+        else:
+            name = func
+            known = (self._function_name_index().get(name) or (None,))[0] if self.functions else None
+        if self._params_harvested:
+            return known.parameters if known else []
+        if not self.elf_file or not self.elf_file.has_dwarf_info():
+            return []
+
+        address = None
+        if known:
+            address = self._normalize_address(known.address)
+        else:
+            for sym in self.iter_symbols(kinds={'STT_FUNC'}):
+                if sym.name == name:
+                    address = self._normalize_address(sym.address)
+                    break
+        key = (name, address)
+        if key in self._param_cache:
+            return self._param_cache[key]
+
+        dwarfinfo = self._get_dwarf_info()
+        if address is None:
+            ordered = list(dwarfinfo.iter_CUs())
+        else:
+            likely, rest = [], []
+            for CU in dwarfinfo.iter_CUs():
+                (likely if self._cu_covers(CU.get_top_DIE(), address) else rest).append(CU)
+            ordered = likely + rest
+
+        defined = None  # first definition at another address
+        declared: List[Dict[str, str]] = []
+        encoded = name.encode('utf-8')
+        for CU in ordered:
+            for DIE, _ in _iter_declaration_DIEs(CU.get_top_DIE()):
+                if DIE.tag != 'DW_TAG_subprogram':
+                    continue
+                attr = DIE.attributes.get('DW_AT_name')
+                if attr is None or attr.value != encoded:
+                    continue
+                if 'DW_AT_declaration' in DIE.attributes:
+                    declared = self._collect_parameters(DIE)
+                    continue
+                low_pc = DIE.attributes.get('DW_AT_low_pc')
+                if address is None or (low_pc is not None
+                                       and self._normalize_address(low_pc.value) == address):
+                    params = self._param_cache[key] = self._collect_parameters(DIE)
+                    return params
+                if defined is None:
+                    defined = self._collect_parameters(DIE)
+        # No definition at the address: the first other one, else the last
+        # prototype, as the full walk would.
+        params = self._param_cache[key] = defined if defined is not None else declared
+        return params
+
+    def _extract_dwarf_parallel(self, max_workers: Optional[int] = None,
+                                min_cus: int = DWARF_PARALLEL_MIN_CUS,
+                                structures: bool = False) -> bool:
+        """Harvest function parameters, DWARF globals and, with ``structures``,
+        the structure table across worker processes.
+
+        Each worker takes every Nth CU (see _parse_cu_range); results are merged
+        back in CU order so the outcome matches the serial _walk_dwarf. Returns False
+        — leaving the caller to run the serial walk — when the ELF is too small to
+        be worth it, only one worker is available, or the pool fails.
+        """
+        if not self.elf_path or not self.elf_file or not self.elf_file.has_dwarf_info():
+            return False
+        workers = max_workers or _dwarf_worker_count()
+        if workers < 2:
+            return False
+        cu_offsets = [CU.cu_offset for CU in self._get_dwarf_info().iter_CUs()]
+        if len(cu_offsets) < min_cus:
+            return False
+        workers = min(workers, len(cu_offsets))
+        shards = [cu_offsets[i::workers] for i in range(workers)]
+        logger.info("Extracting DWARF parameters/globals from %d CUs across %d processes...",
+                    len(cu_offsets), workers)
+        try:
+            # spawn, not fork: the backend worker is multi-threaded and forking a
+            # threaded process can deadlock on inherited locks.
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                per_cu = [r for shard in pool.map(_parse_cu_range,
+                                                  [str(self.elf_path)] * workers, shards,
+                                                  [structures] * workers)
+                          for r in shard]
+        except Exception as e:
+            logger.warning("Parallel DWARF extraction failed: %s. Falling back to serial walk.", e)
+            return False
+
+        per_cu.sort(key=lambda r: r[0])
         func_map = {f.name: f for f in self.functions}
-        for CU in dwarfinfo.iter_CUs():
-            for DIE in CU.iter_DIEs():
-                if DIE.tag == 'DW_TAG_subprogram' and 'DW_AT_name' in DIE.attributes:
-                    try:
-                        func_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                        if func_name in func_map:
-                            params = []
-                            for child in DIE.iter_children():
-                                if child.tag == 'DW_TAG_formal_parameter' and 'DW_AT_name' in child.attributes:
-                                    p_name = child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                                    p_type = "unknown"
-                                    t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                    if t_die: p_type = self._get_type_name(t_die)
-                                    params.append({'name': p_name, 'type': p_type})
-                            func_map[func_name].parameters = params
-                    except: pass
+        for _, cu_vars, cu_params, cu_structs, _ in per_cu:
+            for name, v_type in cu_vars:
+                self.global_vars_dwarf[name] = v_type
+            for func_name, params in cu_params:
+                func = func_map.get(func_name)
+                if func:
+                    func.parameters = params
+            for s_name, fields in cu_structs:
+                if fields or s_name not in self.structures: self.structures[s_name] = fields
+        # Typedefs apply only once every structure is known, as in _walk_dwarf.
+        for *_, cu_typedefs in per_cu:
+            for td_name, resolved in cu_typedefs:
+                self._apply_typedef(td_name, resolved)
+        self._params_harvested = True
+        return True
 
     def extract_structures(self) -> Dict[str, List[Dict[str, str]]]:
         if self.structures: return self.structures
@@ -573,87 +1347,164 @@ class ELFParser:
             if self._try_native_extract():
                 return self.structures
         if not self.elf_file or not self.elf_file.has_dwarf_info(): return {}
-        logger.info("Extracting structures from DWARF info...")
+        self._walk_dwarf(structures=True)
+        return self.structures
+
+    def _get_dwarf_info(self):
+        """pyelftools builds a fresh DWARFInfo (and an empty CU/DIE cache) on
+        every get_dwarf_info() call, so keep one per opened ELF."""
+        if self._dwarfinfo is None:
+            self._dwarfinfo = self.elf_file.get_dwarf_info()
+        return self._dwarfinfo
+
+    def _collect_fields(self, struct_DIE) -> List[Dict[str, str]]:
+        """Members (and C++ bases) of a struct/class/union DIE as ``{'name', 'type'}`` dicts."""
+        fields = []
+        for child in struct_DIE.iter_children():
+            if child.tag == 'DW_TAG_member':
+                f_name = self._dwarf_str(child.attributes['DW_AT_name'].value) if 'DW_AT_name' in child.attributes else "<anonymous>"
+                f_type = self._type_name_of(child) or "unknown"
+                fields.append({'name': f_name, 'type': f_type})
+            elif child.tag == 'DW_TAG_inheritance':
+                b_type = self._type_name_of(child)
+                if b_type: fields.append({'name': '<base>', 'type': b_type})
+        return fields
+
+    def _struct_entry(self, DIE):
+        """``(name, fields)`` for a defining struct/class/union DIE; None for a
+        forward declaration or an anonymous type."""
+        if 'DW_AT_declaration' in DIE.attributes and DIE.attributes['DW_AT_declaration'].value: return None
+        s_name = None
+        if 'DW_AT_name' in DIE.attributes: s_name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
+        elif 'DW_AT_specification' in DIE.attributes:
+            spec = self._get_die_from_attribute(DIE, 'DW_AT_specification')
+            if spec and 'DW_AT_name' in spec.attributes: s_name = self._dwarf_str(spec.attributes['DW_AT_name'].value)
+        if not s_name: return None
+        return s_name, self._collect_fields(DIE)
+
+    def _resolve_typedef(self, dwarfinfo, type_offset: int):
+        """Follow a typedef target through const/volatile/typedef links.
+
+        Returns ``('alias', struct_name)`` when it lands on a forward-declared
+        struct, ``('fields', fields)`` for a defined one, and None otherwise.
+        """
+        try:
+            t_die = dwarfinfo.get_DIE_from_refaddr(type_offset)
+            seen = set()
+            while t_die and t_die.offset not in seen:
+                seen.add(t_die.offset)
+                if t_die.tag in _TYPE_LINK_TAGS: t_die = self._get_die_from_attribute(t_die, 'DW_AT_type')
+                else: break
+
+            if t_die and t_die.tag in _STRUCT_TAGS:
+                if 'DW_AT_declaration' in t_die.attributes and t_die.attributes['DW_AT_declaration'].value:
+                    if 'DW_AT_name' in t_die.attributes:
+                        return 'alias', self._dwarf_str(t_die.attributes['DW_AT_name'].value)
+                    return None
+                return 'fields', self._collect_fields(t_die)
+        except Exception:
+            pass
+        return None
+
+    def _note_type_DIE(self, DIE, links: dict, resolved_at: dict, fields=None) -> None:
+        """Record where a declaration-level type DIE leads, for _resolve_typedef_at.
+
+        const/volatile/typedef DIEs go into ``links`` (offset → target offset);
+        named struct declarations go into ``resolved_at`` as their alias, and a
+        defining struct only when its already-collected ``fields`` are passed
+        in. Nothing else is kept: a chain ending anywhere else is rare enough to
+        re-read, and storing every type DIE would hold one entry per type.
+        """
+        tag = DIE.tag
+        if tag in _TYPE_LINK_TAGS:
+            target = _attr_ref_offset(DIE, 'DW_AT_type')
+            if target is not None: links[DIE.offset] = target
+        elif tag in _STRUCT_TAGS:
+            attrs = DIE.attributes
+            if 'DW_AT_declaration' in attrs and attrs['DW_AT_declaration'].value:
+                if 'DW_AT_name' in attrs:
+                    resolved_at[DIE.offset] = ('alias', self._dwarf_str(attrs['DW_AT_name'].value))
+            elif fields is not None:
+                resolved_at[DIE.offset] = ('fields', fields)
+
+    def _resolve_typedef_at(self, dwarfinfo, type_offset: int, links: dict, resolved_at: dict):
+        """_resolve_typedef answered from the dicts _note_type_DIE filled during
+        the walk. Chains ending on a non-struct type, an anonymous struct or a
+        DIE the walk never reached fall back to decoding the DIE chain."""
+        seen = set()
+        while type_offset in links and type_offset not in seen:
+            seen.add(type_offset)
+            type_offset = links[type_offset]
+        if type_offset in resolved_at: return resolved_at[type_offset]
+        return self._resolve_typedef(dwarfinfo, type_offset)
+
+    def _apply_typedef(self, td_name: str, resolved) -> None:
+        """Record a typedef resolved by _resolve_typedef in self.structures."""
+        kind, value = resolved
+        if kind == 'alias':
+            if value in self.structures: self.structures[td_name] = self.structures[value]
+        elif td_name not in self.structures or value:
+            self.structures[td_name] = value
+
+    def _walk_dwarf(self, params: bool = False, variables: bool = False,
+                    structures: bool = False) -> None:
+        """One declaration-level pass over every CU, feeding whichever of the
+        in-memory collectors are requested: function parameters, file-scope
+        globals and structures. extract_all asks for all three at once so the
+        DWARF is decoded a single time instead of once per collector.
+        """
+        if not (params or variables or structures):
+            return
+        dwarfinfo = self._get_dwarf_info()
+        func_map = {f.name: f for f in self.functions} if params else {}
+        if variables: logger.info("Extracting variables from DWARF info...")
+        if structures: logger.info("Extracting structures from DWARF info...")
         # Fix B: store only scalars — not DIE objects — so the reference chain
         # typedef-list → DIE → CU → raw byte buffer is broken and CU objects can
         # be GC'd by Python's reference counter after each CU is iterated.
-        # Format: {'name': str, 'type_offset': int}  (type_offset is absolute)
+        # typedefs holds (name, typedef DIE offset); links/resolved_at are filled
+        # by _note_type_DIE so most typedefs resolve without touching a DIE again.
         typedefs = []
+        links, resolved_at = {}, {}
         try:
-            dwarfinfo = self.elf_file.get_dwarf_info()
             for CU in dwarfinfo.iter_CUs():
-                for DIE in CU.iter_DIEs():
-                    if DIE.tag in ('DW_TAG_structure_type', 'DW_TAG_class_type', 'DW_TAG_union_type'):
-                        if 'DW_AT_declaration' in DIE.attributes and DIE.attributes['DW_AT_declaration'].value: continue
-                        s_name = None
-                        if 'DW_AT_name' in DIE.attributes: s_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                        elif 'DW_AT_specification' in DIE.attributes:
-                            spec = self._get_die_from_attribute(DIE, 'DW_AT_specification')
-                            if spec and 'DW_AT_name' in spec.attributes: s_name = spec.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-
-                        if s_name:
-                            fields = []
-                            for child in DIE.iter_children():
-                                if child.tag in ('DW_TAG_member', 'DW_TAG_field'):
-                                    f_name = child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace') if 'DW_AT_name' in child.attributes else "<anonymous>"
-                                    f_type = "unknown"
-                                    t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                    if t_die: f_type = self._get_type_name(t_die)
-                                    fields.append({'name': f_name, 'type': f_type})
-                                elif child.tag == 'DW_TAG_inheritance':
-                                    t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                    if t_die: fields.append({'name': '<base>', 'type': self._get_type_name(t_die)})
+                for DIE, depth in _iter_declaration_DIEs(CU.get_top_DIE()):
+                    tag = DIE.tag
+                    if tag == 'DW_TAG_subprogram':
+                        if not params or 'DW_AT_name' not in DIE.attributes: continue
+                        try:
+                            func_name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                            if func_name in func_map:
+                                func_map[func_name].parameters = self._collect_parameters(DIE)
+                        except: pass
+                    elif tag == 'DW_TAG_variable':
+                        if not variables or depth != 1 or 'DW_AT_name' not in DIE.attributes: continue
+                        try:
+                            name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                            v_type = self._type_name_of(DIE) or "unknown"
+                            self.global_vars_dwarf[name] = v_type
+                        except: continue
+                    elif not structures:
+                        continue
+                    elif tag in _STRUCT_TAGS:
+                        entry = self._struct_entry(DIE)
+                        if entry:
+                            s_name, fields = entry
                             if fields or s_name not in self.structures: self.structures[s_name] = fields
-                    elif DIE.tag == 'DW_TAG_typedef':
-                        if 'DW_AT_name' not in DIE.attributes or 'DW_AT_type' not in DIE.attributes:
-                            continue
-                        td_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                        attr = DIE.attributes['DW_AT_type']
-                        abs_offset = attr.value
-                        if hasattr(attr, 'form') and attr.form in (
-                            'DW_FORM_ref1', 'DW_FORM_ref2', 'DW_FORM_ref4',
-                            'DW_FORM_ref8', 'DW_FORM_ref_udata',
-                        ):
-                            abs_offset += CU.cu_offset
-                        typedefs.append({'name': td_name, 'type_offset': abs_offset})
-
-            # Typedef resolution pass — dwarfinfo._CU_cache still holds all CUs
-            # so get_DIE_from_refaddr() works without needing the DIE objects.
-            for td in typedefs:
-                td_name = td['name']
-                try:
-                    t_die = dwarfinfo.get_DIE_from_refaddr(td['type_offset'])
-                    seen = set()
-                    while t_die and t_die.offset not in seen:
-                        seen.add(t_die.offset)
-                        if t_die.tag in ('DW_TAG_const_type', 'DW_TAG_volatile_type', 'DW_TAG_typedef'): t_die = self._get_die_from_attribute(t_die, 'DW_AT_type')
-                        else: break
-
-                    if t_die and t_die.tag in ('DW_TAG_structure_type', 'DW_TAG_class_type', 'DW_TAG_union_type'):
-                        if 'DW_AT_declaration' in t_die.attributes and t_die.attributes['DW_AT_declaration'].value:
-                            if 'DW_AT_name' in t_die.attributes:
-                                target = t_die.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                                if target in self.structures: self.structures[td_name] = self.structures[target]
-                            continue
-                        fields = []
-                        for child in t_die.iter_children():
-                            if child.tag in ('DW_TAG_member', 'DW_TAG_field'):
-                                f_name = child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace') if 'DW_AT_name' in child.attributes else "<anonymous>"
-                                f_type = "unknown"
-                                tt_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                if tt_die: f_type = self._get_type_name(tt_die)
-                                fields.append({'name': f_name, 'type': f_type})
-                            elif child.tag == 'DW_TAG_inheritance':
-                                tt_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                if tt_die: fields.append({'name': '<base>', 'type': self._get_type_name(tt_die)})
-                        if td_name not in self.structures or fields: self.structures[td_name] = fields
-                except Exception:
-                    pass
+                        self._note_type_DIE(DIE, links, resolved_at, entry[1] if entry else None)
+                    else:
+                        self._note_type_DIE(DIE, links, resolved_at)
+                        if tag == 'DW_TAG_typedef' and 'DW_AT_name' in DIE.attributes and DIE.offset in links:
+                            typedefs.append((self._dwarf_str(DIE.attributes['DW_AT_name'].value), DIE.offset))
+
+            # Typedef resolution pass — runs after every CU so forward and
+            # cross-CU references are already in links/resolved_at.
+            for td_name, td_offset in typedefs:
+                resolved = self._resolve_typedef_at(dwarfinfo, td_offset, links, resolved_at)
+                if resolved:
+                    self._apply_typedef(td_name, resolved)
         except: pass
-
-        del typedefs
-        gc.collect()
-        return self.structures
+        if params: self._params_harvested = True
 
     def extract_dwarf_variables(self) -> Dict[str, str]:
         if self.global_vars_dwarf: return self.global_vars_dwarf
@@ -661,38 +1512,9 @@ class ELFParser:
             if self._try_native_extract():
                 return self.global_vars_dwarf
         if not self.elf_file or not self.elf_file.has_dwarf_info(): return {}
-        logger.info("Extracting variables from DWARF info...")
-        try:
-            dwarfinfo = self.elf_file.get_dwarf_info()
-            for CU in dwarfinfo.iter_CUs():
-                top = CU.get_top_DIE()
-                for child in top.iter_children():
-                    if child.tag == 'DW_TAG_variable' and 'DW_AT_name' in child.attributes:
-                        try:
-                            name = child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                            v_type = "unknown"
-                            t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                            if t_die: v_type = self._get_type_name(t_die)
-                            self.global_vars_dwarf[name] = v_type
-                        except: continue
-        except: pass
+        self._walk_dwarf(variables=True)
         return self.global_vars_dwarf
 
-    def search_function(self, name:str, exact: bool = False) -> List[Function]:
-        if not self.functions: self.extract_functions()
-        name = name.strip()
-        filtered = [f for f in self.functions if "_EXIT_" not in f.name and not f.name.endswith("_function_end")]
-        if exact: return [f for f in filtered if f.name == name]
-        results = [f for f in filtered if name.lower() in f.name.lower()]
-        results.sort(key=lambda f: f.name != name)
-        return results
-
-    def get_symbol_by_address(self, address: int) -> Optional[Symbol]:
-        if not self.symbols: self.extract_symbols()
-        for sym in self.symbols:
-            if sym.address == address: return sym
-        return None
-
     def get_function_containing_address(self, address: int) -> Optional[Function]:
         if not self._sorted_func_addrs:
             if self._db and self._active_elf_hash:
@@ -702,40 +1524,83 @@ class ELFParser:
         norm_addr = self._normalize_address(address)
         idx = bisect.bisect_right(self._sorted_func_addrs, norm_addr)
         if idx == 0: return None
-        candidate = self._func_addr_map[self._sorted_func_addrs[idx - 1]]
+        candidate = self._sorted_funcs[idx - 1]
         if candidate.size > 0 and candidate.address <= norm_addr < (candidate.address + candidate.size):
             return candidate
         return None
 
     def _get_capstone_instance(self, address: int = 0):
+        """Capstone engine for the ELF's architecture (ARM: Thumb when bit 0 of
+        ``address`` is set), configured once and reused across calls.
+
+        The architecture is fixed once the ELF is loaded (the cache is reset
+        with it), so the key is just the mode bit _load_elf_file selected.
+        """
         if not CAPSTONE_AVAILABLE or not self.elf_file: return None
-        arch = self.elf_file.get_machine_arch()
+        key = address & self._cs_mode_mask
+        md = self._cs_cache.get(key)
+        if md is None:
+            md = self._new_capstone_instance(self._machine_arch, address)
+            if md is None: return None
+            # Enable skipdata to skip unknown instructions. Detail mode would
+            # build operand objects for every instruction; extract_subcalls
+            # only reads the lite tuples' operand text.
+            md.skipdata = True
+            md.detail = False
+            self._cs_cache[key] = md
+        return md
+
+    @staticmethod
+    def _new_capstone_instance(arch: Optional[str], address: int):
+        cs = _capstone()
+        if cs is None: return None
         try:
-            if arch == 'ARM': return capstone.Cs(CS_ARCH_ARM, CS_MODE_THUMB if address & 1 else CS_MODE_ARM)
-            elif arch == 'AArch64': return capstone.Cs(CS_ARCH_ARM64, CS_MODE_ARM)
-            elif arch in ['x86', 'Intel 80386']: return capstone.Cs(CS_ARCH_X86, CS_MODE_32)
-            elif arch in ['x64', 'AMD64', 'x86-64']: return capstone.Cs(CS_ARCH_X86, CS_MODE_64)
-            elif arch == 'MIPS': return capstone.Cs(CS_ARCH_MIPS, CS_MODE_MIPS32)
-            elif 'TriCore' in arch: return capstone.Cs(CS_ARCH_TRICORE, CS_MODE_TRICORE_162)
+            if arch == 'ARM': return cs.Cs(cs.CS_ARCH_ARM, cs.CS_MODE_THUMB if address & 1 else cs.CS_MODE_ARM)
+            elif arch == 'AArch64': return cs.Cs(cs.CS_ARCH_ARM64, cs.CS_MODE_ARM)
+            elif arch in ['x86', 'Intel 80386']: return cs.Cs(cs.CS_ARCH_X86, cs.CS_MODE_32)
+            elif arch in ['x64', 'AMD64', 'x86-64']: return cs.Cs(cs.CS_ARCH_X86, cs.CS_MODE_64)
+            elif arch == 'MIPS': return cs.Cs(cs.CS_ARCH_MIPS, cs.CS_MODE_MIPS32)
+            elif 'TriCore' in arch: return cs.Cs(cs.CS_ARCH_TRICORE, cs.CS_MODE_TRICORE_162)
         except: return None
         return None
 
+    def _get_exec_sections(self):
+        """``(starts, spans, ordered)`` for the non-empty executable sections.
+
+        ``spans`` are ``(start, end, data)`` sorted by address, ``starts`` their
+        keys for bisect; each section's bytes are read once, so
+        get_function_bytes is a bisect and a slice rather than a scan that
+        re-read the whole section for every function. When two ranges overlap
+        (a relocatable object puts every section at 0) ``ordered`` holds the
+        spans in header order instead of None, and is scanned so the first
+        matching section still wins.
+        """
+        if self._exec_sections is None:
+            ordered = [(sec['sh_addr'], sec['sh_addr'] + sec['sh_size'], sec.data())
+                       for sec in self._get_sections()
+                       if sec['sh_flags'] & 0x4 and sec['sh_size']]
+            spans = sorted(ordered, key=lambda span: span[0])
+            overlap = any(prev[1] > cur[0] for prev, cur in zip(spans, spans[1:]))
+            self._exec_sections = ([span[0] for span in spans], spans,
+                                   ordered if overlap else None)
+        return self._exec_sections
+
     def get_function_bytes(self, func: Function) -> bytes:
         if not self.elf_file and not self._ensure_elf_file_open(): return b""
         if not self.elf_file: return b""
-        for section in self.elf_file.iter_sections():
-            if section['sh_flags'] & 0x4:
-                start = section['sh_addr']
-                size = section['sh_size']
-                func_addr = self._normalize_address(func.address)
-                if start <= func_addr < start + size:
-                    offset = func_addr - start
-                    read_size = size - offset if offset + func.size > size else func.size
-                    return section.data()[offset : offset + read_size]
+        starts, spans, ordered = self._get_exec_sections()
+        func_addr = self._normalize_address(func.address)
+        if ordered is None:
+            idx = bisect.bisect_right(starts, func_addr) - 1
+            ordered = spans[idx:idx + 1] if idx >= 0 else ()
+        for start, end, data in ordered:
+            if start <= func_addr < end:
+                offset = func_addr - start
+                return data[offset : offset + func.size]
         return b""
 
     def extract_subcalls(self, func_name: str) -> List[str]:
-        if not CAPSTONE_AVAILABLE: return ["Capstone not installed"]
+        if _capstone() is None: return ["Capstone not installed"]
         if not self._sorted_func_addrs:
             if self._db and self._active_elf_hash:
                 self._rebuild_function_address_map_from_db()
@@ -745,7 +1610,8 @@ class ELFParser:
             matches = self.search_function(func_name, exact=True)
             func = matches[0] if matches else None
         else:
-            func = next((f for f in self.functions if f.name == func_name), None)
+            # First function of that name in list order, from the name index.
+            func = (self._function_name_index().get(func_name) or (None,))[0]
         if not func: return ["Function not found"]
         
         # If size is 0, try to estimate it from next function
@@ -763,41 +1629,40 @@ class ELFParser:
 
         md = self._get_capstone_instance(func.address)
         if not md: return ["Capstone init failed"]
-        
-        # Enable skipdata to skip unknown instructions
-        md.skipdata = True
-        # Detail mode is required to inspect insn.operands below.
-        md.detail = True
 
-        calls = set()
+        targets = set()
         start_addr = self._normalize_address(func.address)
         
         instruction_count = 0
         try:
-            # Use disasm generator to avoid loading all instructions into memory
-            for insn in md.disasm(code, start_addr):
+            # disasm_lite yields (address, size, mnemonic, op_str) tuples
+            # lazily, without allocating a CsInsn per instruction.
+            for _, _, mnemonic, op_str in md.disasm_lite(code, start_addr):
                 instruction_count += 1
-                # Added CALLA, FCALL for TriCore
-                if insn.mnemonic.upper() in ['CALL', 'BL', 'BLX', 'JAL', 'JALR', 'JL', 'CALLA', 'FCALL']:
-                    if len(insn.operands) > 0:
-                        op = insn.operands[0]
-                        if op.type == 2: # IMM
-                            # Fix: Mask address to 32-bit to avoid signed/unsigned mismatch issues
-                            target = op.imm & 0xFFFFFFFF
-                            norm_target = self._normalize_address(target)
-                            
-                            # Priority 1: Exact Function Match from Map
-                            if norm_target in self._func_addr_map:
-                                calls.add(self._func_addr_map[norm_target].name)
-                            else:
-                                # Priority 2: Containing Function
-                                cont_func = self.get_function_containing_address(target)
-                                if cont_func: calls.add(cont_func.name)
-                                else:
-                                    # Priority 3: Symbol Table
-                                    sym = self.get_symbol_by_address(target)
-                                    if sym: calls.add(sym.name)
-                                    else: calls.add(f"0x{target:x}")
+                if mnemonic in _CALL_MNEMONICS:
+                    imm = _IMM_OPERAND_RE.fullmatch(op_str)
+                    if imm:
+                        text = imm.group(1)
+                        # Fix: Mask address to 32-bit to avoid signed/unsigned mismatch issues
+                        targets.add(int(text, 16 if 'x' in text else 10) & 0xFFFFFFFF)
+
+            # Name each distinct target once, however often it is called.
+            calls = set()
+            for target in targets:
+                norm_target = self._normalize_address(target)
+
+                # Priority 1: Exact Function Match from Map
+                if norm_target in self._func_addr_map:
+                    calls.add(self._func_addr_map[norm_target].name)
+                else:
+                    # Priority 2: Containing Function
+                    cont_func = self.get_function_containing_address(target)
+                    if cont_func: calls.add(cont_func.name)
+                    else:
+                        # Priority 3: Symbol Table
+                        sym = self.get_symbol_by_address(target)
+                        if sym: calls.add(sym.name)
+                        else: calls.add(f"0x{target:x}")
         except Exception as e:
             return [f"Disassembly error: {e}"]
             
@@ -841,7 +1706,7 @@ class ELFParser:
 
                 n_sym = len(data.get("symbols", []))
                 n_fn = len(data.get("functions", []))
-                logger.info(f"Writing {n_sym} symbols and {n_fn} functions to the database…")
+                logger.info("Writing %d symbols and %d functions to the database…", n_sym, n_fn)
                 db.bulk_insert_symbols(self.md5_hash, data.get("symbols", []))
                 db.bulk_insert_functions(self.md5_hash, data.get("functions", []))
                 logger.info("Writing structures and global variables…")
@@ -857,16 +1722,14 @@ class ELFParser:
                 self.close()
                 return
             except Exception as e:
-                logger.warning(f"Native streaming extraction failed: {e}. Falling back to Python streaming.")
+                logger.warning("Native streaming extraction failed: %s. Falling back to Python streaming.", e)
                 self.parser_backend = "pyelftools"
                 if not self.elf_file:
                     try:
-                        with open(self.elf_path, 'rb') as f:
-                            raw_data = f.read()
-                        self.stream = io.BytesIO(raw_data)
+                        self.stream = self._open_elf_stream()
                         self._load_elf_file()
                     except Exception as e2:
-                        logger.error(f"Failed to open ELF file for fallback parser: {e2}")
+                        logger.error("Failed to open ELF file for fallback parser: %s", e2)
 
         # -- Phase 1: symbols (streamed in batches) --------------------------
         BATCH = 2000
@@ -896,8 +1759,8 @@ class ELFParser:
         # global vars are flushed to DB after each CU so only one CU's worth
         # of data is held in Python at a time.  Typedef DIEs are replaced with
         # plain scalar dicts (Fix B) to break the DIE→CU→buffer reference chain.
-        logger.info(f"Found {len(functions)} functions; extracting DWARF debug info "
-                    "(parameters, structures, globals)…")
+        logger.info("Found %d functions; extracting DWARF debug info "
+                    "(parameters, structures, globals)…", len(functions))
         self.functions = functions
         self._extract_dwarf_single_pass(db)
         self.functions = []
@@ -912,7 +1775,6 @@ class ELFParser:
         self._active_elf_hash = self.md5_hash
         db.commit()
         self.close()
-        gc.collect()
 
     # ------------------------------------------------------------------
     # Single-pass DWARF extraction (Fix A + Fix B)
@@ -939,37 +1801,28 @@ class ELFParser:
             db.bulk_insert_functions(self.md5_hash, self.functions)
             return
 
-        dwarfinfo = self.elf_file.get_dwarf_info()
+        dwarfinfo = self._get_dwarf_info()
         func_map = {f.name: f for f in self.functions}
 
         # Typedefs: plain scalars only — no DIE/CU references held across CUs.
-        all_typedefs: list = []  # [{'name': str, 'type_offset': int}, ...]
-
-        _STRUCT_TAGS = ('DW_TAG_structure_type', 'DW_TAG_class_type', 'DW_TAG_union_type')
-        _REL_REF_FORMS = frozenset((
-            'DW_FORM_ref1', 'DW_FORM_ref2', 'DW_FORM_ref4',
-            'DW_FORM_ref8', 'DW_FORM_ref_udata',
-        ))
+        # Each CU's typedefs are resolved when its walk ends, against links /
+        # resolved_at scoped to that CU, so neither grows past one CU's types;
+        # a cross-CU reference re-reads the DIE. Defining structs are left out
+        # of resolved_at so their field lists are not kept alive past the
+        # per-CU flush; those typedefs re-read the DIE too.
+        resolved_typedefs: list = []  # [(name, _resolve_typedef result), ...]
 
         for CU in dwarfinfo.iter_CUs():
             cu_structures: dict = {}
             cu_vars: dict = {}
-
-            # Track depth so we can recognise file-scope (depth-1) variables.
-            # Null DIEs (tag=None) in the DWARF byte stream signal the end of
-            # a sibling list and decrement depth; a DIE with has_children=True
-            # increments it for the next round of siblings.
-            depth = 0
-
-            for DIE in CU.iter_DIEs():
-                if DIE.tag is None:      # DWARF null terminator — close scope
-                    depth -= 1
-                    continue
-
-                current_depth = depth
-                if DIE.has_children:
-                    depth += 1
-
+            cu_typedefs: list = []  # [(name, typedef DIE offset), ...]
+            links: dict = {}
+            resolved_at: dict = {}
+
+            # Declaration-level walk: function bodies are stepped over via
+            # DW_AT_sibling instead of being decoded DIE by DIE. depth == 1
+            # marks a file-scope (direct child of the compile unit) DIE.
+            for DIE, current_depth in _iter_declaration_DIEs(CU.get_top_DIE()):
                 tag = DIE.tag
 
                 # --- function parameter enrichment ---
@@ -977,133 +1830,89 @@ class ELFParser:
                     if 'DW_AT_name' not in DIE.attributes:
                         continue
                     try:
-                        func_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
+                        func_name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
                         if func_name in func_map:
-                            params = []
-                            for child in DIE.iter_children():
-                                if (child.tag == 'DW_TAG_formal_parameter'
-                                        and 'DW_AT_name' in child.attributes):
-                                    p_name = child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                                    p_type = "unknown"
-                                    t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                    if t_die:
-                                        p_type = self._get_type_name(t_die)
-                                    params.append({'name': p_name, 'type': p_type})
-                            func_map[func_name].parameters = params
+                            func_map[func_name].parameters = self._collect_parameters(DIE)
                     except Exception:
                         pass
 
                 # --- structure / class / union extraction ---
                 elif tag in _STRUCT_TAGS:
+                    self._note_type_DIE(DIE, links, resolved_at)
                     if ('DW_AT_declaration' in DIE.attributes
                             and DIE.attributes['DW_AT_declaration'].value):
                         continue
                     s_name = None
                     if 'DW_AT_name' in DIE.attributes:
-                        s_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
+                        s_name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
                     elif 'DW_AT_specification' in DIE.attributes:
                         spec = self._get_die_from_attribute(DIE, 'DW_AT_specification')
                         if spec and 'DW_AT_name' in spec.attributes:
-                            s_name = spec.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
+                            s_name = self._dwarf_str(spec.attributes['DW_AT_name'].value)
                     if s_name:
-                        fields = []
-                        for child in DIE.iter_children():
-                            if child.tag in ('DW_TAG_member', 'DW_TAG_field'):
-                                f_name = (child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                                          if 'DW_AT_name' in child.attributes else "<anonymous>")
-                                f_type = "unknown"
-                                t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                if t_die:
-                                    f_type = self._get_type_name(t_die)
-                                fields.append({'name': f_name, 'type': f_type})
-                            elif child.tag == 'DW_TAG_inheritance':
-                                t_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                                if t_die:
-                                    fields.append({'name': '<base>', 'type': self._get_type_name(t_die)})
+                        fields = self._collect_fields(DIE)
                         if fields or s_name not in cu_structures:
                             cu_structures[s_name] = fields
 
                 # --- typedef: store only scalars (Fix B) ---
                 elif tag == 'DW_TAG_typedef':
-                    if 'DW_AT_name' not in DIE.attributes or 'DW_AT_type' not in DIE.attributes:
+                    self._note_type_DIE(DIE, links, resolved_at)
+                    if 'DW_AT_name' not in DIE.attributes or DIE.offset not in links:
                         continue
-                    td_name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                    attr = DIE.attributes['DW_AT_type']
-                    abs_offset = attr.value
-                    if hasattr(attr, 'form') and attr.form in _REL_REF_FORMS:
-                        abs_offset += CU.cu_offset
-                    all_typedefs.append({'name': td_name, 'type_offset': abs_offset})
+                    td_name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                    cu_typedefs.append((td_name, DIE.offset))
 
                 # --- file-scope global variable (direct child of compile unit) ---
                 elif tag == 'DW_TAG_variable' and current_depth == 1:
                     if 'DW_AT_name' not in DIE.attributes:
                         continue
                     try:
-                        name = DIE.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                        v_type = "unknown"
-                        t_die = self._get_die_from_attribute(DIE, 'DW_AT_type')
-                        if t_die:
-                            v_type = self._get_type_name(t_die)
+                        name = self._dwarf_str(DIE.attributes['DW_AT_name'].value)
+                        v_type = self._type_name_of(DIE) or "unknown"
                         cu_vars[name] = v_type
                     except Exception:
                         continue
 
+                # --- const/volatile types: typedef chain links ---
+                else:
+                    self._note_type_DIE(DIE, links, resolved_at)
+
+            # Resolved once the whole CU is walked, so forward references hit.
+            for td_name, td_offset in cu_typedefs:
+                resolved = self._resolve_typedef_at(dwarfinfo, td_offset, links, resolved_at)
+                if resolved:
+                    resolved_typedefs.append((td_name, resolved))
+
             # Flush after each CU — only one CU's worth of data in memory
             if cu_structures:
                 db.bulk_insert_structures(self.md5_hash, cu_structures)
             if cu_vars:
                 db.bulk_insert_global_vars(self.md5_hash, cu_vars)
+            # The DIE-offset memo from _type_name_of, its name pool and the name
+            # cache would otherwise hold one entry per type / name in the ELF.
+            self._type_names = {}
+            self._type_pool = {}
+            self._dwarf_strs = {}
 
         # Flush enriched functions once (they were built incrementally via func_map)
         db.bulk_insert_functions(self.md5_hash, self.functions)
+        self._params_harvested = True
 
-        # --- typedef resolution pass ---
-        # pyelftools' _CU_cache still holds all CU objects, so get_DIE_from_refaddr
-        # works even though we dropped our Python-level references above.
+        # --- typedef pass ---
+        # Aliases are looked up once every CU's structures are in the DB.
         typedef_structs: dict = {}
-        for td in all_typedefs:
-            td_name = td['name']
-            try:
-                t_die = dwarfinfo.get_DIE_from_refaddr(td['type_offset'])
-                seen: set = set()
-                while t_die and t_die.offset not in seen:
-                    seen.add(t_die.offset)
-                    if t_die.tag in ('DW_TAG_const_type', 'DW_TAG_volatile_type', 'DW_TAG_typedef'):
-                        t_die = self._get_die_from_attribute(t_die, 'DW_AT_type')
-                    else:
-                        break
-
-                if t_die and t_die.tag in _STRUCT_TAGS:
-                    if ('DW_AT_declaration' in t_die.attributes
-                            and t_die.attributes['DW_AT_declaration'].value):
-                        # Forward declaration: resolve alias via DB lookup
-                        if 'DW_AT_name' in t_die.attributes:
-                            target = t_die.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                            row = db.execute(
-                                "SELECT fields FROM elf_structures"
-                                " WHERE elf_hash=? AND name=? LIMIT 1",
-                                (self.md5_hash, target)
-                            ).fetchone()
-                            if row:
-                                typedef_structs[td_name] = json.loads(row[0])
-                        continue
-                    fields = []
-                    for child in t_die.iter_children():
-                        if child.tag in ('DW_TAG_member', 'DW_TAG_field'):
-                            f_name = (child.attributes['DW_AT_name'].value.decode('utf-8', errors='replace')
-                                      if 'DW_AT_name' in child.attributes else "<anonymous>")
-                            f_type = "unknown"
-                            tt_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                            if tt_die:
-                                f_type = self._get_type_name(tt_die)
-                            fields.append({'name': f_name, 'type': f_type})
-                        elif child.tag == 'DW_TAG_inheritance':
-                            tt_die = self._get_die_from_attribute(child, 'DW_AT_type')
-                            if tt_die:
-                                fields.append({'name': '<base>', 'type': self._get_type_name(tt_die)})
-                    typedef_structs[td_name] = fields
-            except Exception:
-                pass
+        for td_name, (kind, value) in resolved_typedefs:
+            if kind == 'fields':
+                typedef_structs[td_name] = value
+                continue
+            # Forward declaration: resolve alias via DB lookup
+            row = db.execute(
+                "SELECT fields FROM elf_structures"
+                " WHERE elf_hash=? AND name=? LIMIT 1",
+                (self.md5_hash, value)
+            ).fetchone()
+            if row:
+                typedef_structs[td_name] = json.loads(row[0])
 
         if typedef_structs:
             db.bulk_insert_structures(self.md5_hash, typedef_structs)
@@ -1139,7 +1948,6 @@ class ELFParser:
 
         # Free parser/pyelftools RAM after the DB owns the data.
         self.close()
-        gc.collect()
 
     def load_from_db(self, db, elf_hash: str) -> None:
         """
@@ -1158,12 +1966,12 @@ class ELFParser:
         if not self._db or not self._active_elf_hash:
             return
         rows = self._db.get_functions_for_address_map(self._active_elf_hash)
-        self._func_addr_map = {}
+        addr_map = {}
         for r in rows:
             name, address, size = r[0], r[1], r[2]
             norm = self._normalize_address(address)
-            self._func_addr_map[norm] = Function(name, address, size, [])
-        self._sorted_func_addrs = sorted(self._func_addr_map.keys())
+            addr_map[norm] = Function(name, address, size, [])
+        self._set_function_address_map(addr_map)
 
     def export_elf_cache(self, cache_dir: str) -> Optional[str]:
         """
@@ -1235,7 +2043,7 @@ class ELFParser:
                 f.write("}")
             return out_path
         except Exception as e:
-            logger.warning(f"Failed to export ELF cache: {e}")
+            logger.warning("Failed to export ELF cache: %s", e)
             return None
 
     @staticmethod
@@ -1244,10 +2052,9 @@ class ELFParser:
         Import a JSON cache file directly into the DB without building in-memory lists.
         Returns the elf_hash on success, None on failure.
         """
-        import json as _json
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = _json.load(f)
+            with open(json_path, "rb") as f:
+                data = _json_loads(f.read())
             if "database" in data:
                 data = data["database"]
 
@@ -1266,7 +2073,7 @@ class ELFParser:
             db.bulk_insert_global_vars(elf_hash, data.get("global_vars", {}))
             return elf_hash
         except Exception as e:
-            logger.warning(f"Failed to import ELF cache to DB: {e}")
+            logger.warning("Failed to import ELF cache to DB: %s", e)
             return None
 
     # ------------------------------------------------------------------
@@ -1282,13 +2089,16 @@ class ELFParser:
         if not self.functions:
             self.extract_functions()
         name = name.strip()
-        filtered = [f for f in self.functions
-                    if "_EXIT_" not in f.name and not f.name.endswith("_function_end")]
+        # Exact hits come straight from the name index; a fuzzy search lists
+        # them first, then the remaining substring matches in list order
+        # (the same order the old stable sort on ``f.name != name`` produced).
+        exact_hits = [f for f in self._function_name_index().get(name, ())
+                      if "_EXIT_" not in f.name and not f.name.endswith("_function_end")]
         if exact:
-            return [f for f in filtered if f.name == name]
-        results = [f for f in filtered if name.lower() in f.name.lower()]
-        results.sort(key=lambda f: f.name != name)
-        return results
+            return exact_hits
+        return exact_hits + [f for f in self._function_substring_matches(name.lower())
+                             if f.name != name
+                             and "_EXIT_" not in f.name and not f.name.endswith("_function_end")]
 
     def get_symbol_by_address(self, address: int) -> Optional[Symbol]:
         if self._db and self._active_elf_hash:
@@ -1299,24 +2109,120 @@ class ELFParser:
         # Fallback
         if not self.symbols:
             self.extract_symbols()
-        for sym in self.symbols:
-            if sym.address == address:
-                return sym
-        return None
+        row = self._symbol_address_index().get(address)
+        return None if row is None else self.symbols[row]
 
     def get_statistics(self) -> Dict[str, Union[int, str]]:
         if self._db and self._active_elf_hash:
             return self._db.get_elf_stats(self._active_elf_hash)
         if not self.symbols:
             self.extract_symbols()
+        # One pass over the symbols for every type and binding count.
+        syms = self.symbols
+        if isinstance(syms, SymbolTable):
+            # Count the id columns directly; no Symbol is materialised.
+            types = collections.Counter({syms.label(k): n for k, n in collections.Counter(syms.type_ids).items()})
+            binds = collections.Counter({syms.label(k): n for k, n in collections.Counter(syms.binding_ids).items()})
+        else:
+            types = collections.Counter()
+            binds = collections.Counter()
+            for sym in syms:
+                types[sym.symbol_type] += 1
+                binds[sym.binding] += 1
         return {
             'total_symbols': len(self.symbols),
-            'functions': len([s for s in self.symbols if s.symbol_type == 'STT_FUNC']),
-            'objects': len([s for s in self.symbols if s.symbol_type == 'STT_OBJECT']),
+            'functions': types['STT_FUNC'],
+            'objects': types['STT_OBJECT'],
+            'global_symbols': binds['STB_GLOBAL'],
+            'local_symbols': binds['STB_LOCAL'],
+            'weak_symbols': binds['STB_WEAK'],
             'parser_backend': self.parser_backend
         }
 
-def main():
+def _run_batch(args) -> int:
+    """Non-interactive ``--elf`` run: parse, print stats, optionally search and
+    dump. Returns a process exit code, so it can be timed or scripted."""
+    import time
+
+    parser = ELFParser()
+    start = time.perf_counter()
+    try:
+        parser.load_elf(args.elf)
+        if args.no_dwarf:
+            parser.extract_symbols()
+            parser.extract_functions()
+        else:
+            parser.extract_all()
+    except Exception as e:
+        logger.error("Error loading ELF: %s", e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    stats = parser.get_statistics()
+    print(f"{Path(args.elf).name}: {stats['total_symbols']} symbols, "
+          f"{len(parser.functions)} functions, {len(parser.structures)} structures, "
+          f"{len(parser.global_vars_dwarf)} DWARF globals "
+          f"({stats['parser_backend']}, {elapsed:.3f}s)")
+
+    for term in args.search or ():
+        results = parser.search_function(term)
+        print(f"\n{term}: {len(results)} match(es)")
+        for func in results:
+            print(f"  {func}")
+
+    if args.dump_json:
+        out = os.path.abspath(args.dump_json)
+        # save_cache logs its own error; a file left by an earlier run
+        # must not pass for a successful dump.
+        if not parser.save_cache(out):
+            return 1
+        print(f"\nWrote {out}")
+    return 0
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        description="Inspect an ELF file. Without --elf, starts the interactive menu.")
+    ap.add_argument("--elf", help="ELF file to parse non-interactively")
+    ap.add_argument("--search", action="append", metavar="NAME",
+                    help="substring function search (repeatable)")
+    ap.add_argument("--dump-json", metavar="PATH",
+                    help="write the parsed data as a JSON cache file")
+    ap.add_argument("--no-dwarf", action="store_true",
+                    help="symbols and functions only; skip the DWARF walk")
+    args = ap.parse_args(argv)
+    if args.elf:
+        return _run_batch(args)
+    return _interactive_main()
+
+
+# Pointer stars and qualifiers the interactive CLI strips from a field or
+# variable type to find the struct it names, in one pass.
+_TYPE_DECOR_RE = re.compile(r'\*|const |volatile |struct ')
+
+# Mode-2 matches listed per page; the rest are only collected on "m".
+_CLI_PAGE_SIZE = 50
+
+
+def _make_cli_input():
+    """input() for the interactive menu. On a terminal it is input() itself;
+    with piped stdin the whole script is read once up front, each prompt takes
+    the next line, and running out of lines answers 'q' instead of raising
+    EOFError into the generic error handler."""
+    if sys.stdin is None or sys.stdin.isatty():
+        return input
+    lines = iter(sys.stdin.read().splitlines())
+
+    def scripted_input(prompt=""):
+        sys.stdout.write(prompt)
+        return next(lines, "q")
+    return scripted_input
+
+
+def _interactive_main():
+    ask = _make_cli_input()
     project_root = Path(os.getcwd())
     resources_dir = project_root / "Resources"
     resources_dir.mkdir(exist_ok=True)
@@ -1328,14 +2234,14 @@ def main():
     print("2. Load JSON Database")
     print("q. Quit")
     
-    choice = input("\n> ").strip().lower()
+    choice = ask("\n> ").strip().lower()
     if choice == 'q': return
 
     parser = ELFParser()
     
     if choice == '1':
         print("Enter the path to the .elf file: ")
-        elf_path = input().strip()
+        elf_path = ask().strip()
         cache_file = resources_dir / (Path(elf_path).name + ".json")
         
         try:
@@ -1343,16 +2249,24 @@ def main():
             
             loaded_from_cache = False
             if cache_file.exists():
-                # Check cache
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                
-                if data.get("elf_hash") == parser.md5_hash:
+                # Check cache: the stored hash is peeked from the file head, so
+                # a stale cache is never decoded. A matching one is decoded
+                # once into a side parser, which is kept instead of re-reading it.
+                cached = None
+                if _peek_cache_hash(cache_file) in (None, parser.md5_hash):
+                    cached = ELFParser()
+                    if not (cached.load_cache(str(cache_file)) and cached.md5_hash == parser.md5_hash):
+                        cached.close()
+                        cached = None
+                if cached is not None:
                     print(f"\nCache found for {Path(elf_path).name} and matches ELF.")
                     print("Load from cache? (Y/n)")
-                    if input("> ").strip().lower() != 'n':
-                        if parser.load_cache(str(cache_file)):
-                            loaded_from_cache = True
+                    if ask("> ").strip().lower() != 'n':
+                        parser.close()
+                        parser = cached
+                        loaded_from_cache = True
+                    else:
+                        cached.close()
                 else:
                     print("\nCache found but MD5 mismatch. Re-parsing ELF...")
             
@@ -1363,7 +2277,7 @@ def main():
                 parser.save_cache(str(cache_file))
                 
         except Exception as e:
-            logger.error(f"Error loading ELF: {e}")
+            logger.error("Error loading ELF: %s", e)
             return
 
     elif choice == '2':
@@ -1378,7 +2292,7 @@ def main():
             
         print("\nSelect database to load:")
         try:
-            idx = int(input("> ").strip())
+            idx = int(ask("> ").strip())
             if 1 <= idx <= len(json_files):
                 target_json = json_files[idx-1]
                 print(f"Loading {target_json.name}...")
@@ -1396,25 +2310,52 @@ def main():
         return
 
     # Main Interaction Loop
+    # Mode 2 searches go through one lowered buffer per kind, built on first use.
+    struct_names = var_items = struct_index = var_index = None
+    # Re-selecting a function reprints its subcalls without disassembling again.
+    subcalls_cache = {}
     try:
-        # Helper for printing tree
-        def print_struct_tree(struct_name, indent="  ", visited=None):
-            if visited is None: visited = set()
-            if struct_name in visited:
-                print(f"{indent}...(recursive {struct_name})")
-                return
-            visited.add(struct_name)
-            
-            if struct_name in parser.structures:
-                print(f"{indent}Structure: {struct_name}")
-                for field in parser.structures[struct_name]:
-                    f_name, f_type = field['name'], field['type']
-                    base = f_type.replace('*','').replace('const ','').replace('volatile ','').replace('struct ','').strip()
-                    if base in parser.structures:
-                        print(f"{indent}  - {f_name}: {f_type}")
-                        print_struct_tree(base, indent + "    ", visited.copy())
-                    else:
-                        print(f"{indent}  - {f_name}: {f_type}")
+        # Helper for printing tree: appends newline-terminated lines to ``out``;
+        # each render reaches stdout as one write.
+        def print_struct_tree(struct_name, out, indent="  "):
+            # Iterative DFS with a colour map: ``path`` (grey) holds the
+            # structs on the branch being expanded, ``shown`` (black) the ones
+            # already printed in full. Each struct is expanded once per tree,
+            # so a type graph where many fields share sub-structs stays linear
+            # in the number of structs instead of growing with every path.
+            # The per-field work runs on locals: one dict probe per struct
+            # and per field type, no attribute lookups inside the loops.
+            structures = parser.structures
+            strip_decor = _TYPE_DECOR_RE.sub
+            path, shown = set(), set()
+            stack = [('visit', struct_name, indent)]
+            while stack:
+                op, name, indent = stack.pop()
+                if op == 'line':
+                    out.append(name)
+                elif op == 'leave':
+                    path.discard(name)
+                    shown.add(name)
+                elif name in path:
+                    out.append(f"{indent}...(recursive {name})\n")
+                elif name in shown:
+                    out.append(f"{indent}...(already shown: {name})\n")
+                else:
+                    fields = structures.get(name)
+                    if fields is None:
+                        continue
+                    out.append(f"{indent}Structure: {name}\n")
+                    path.add(name)
+                    child_indent = indent + "    "
+                    todo = []
+                    for field in fields:
+                        f_type = field['type']
+                        todo.append(('line', f"{indent}  - {field['name']}: {f_type}\n", None))
+                        base = strip_decor('', f_type).strip()
+                        if base in structures:
+                            todo.append(('visit', base, child_indent))
+                    todo.append(('leave', name, None))
+                    stack.extend(reversed(todo))
 
         while True:
             print("\n" + "=" * 60)
@@ -1424,12 +2365,12 @@ def main():
             print("q. Quit")
             print("="*60)
             
-            mode = input("\n> ").strip().lower()
+            mode = ask("\n> ").strip().lower()
             if mode == 'q': break
             
             if mode == '1':
                 print("Enter function name to search:")
-                usr_fct = input("> ").strip()
+                usr_fct = ask("> ").strip()
                 if not usr_fct: continue
                 
                 results = parser.search_function(usr_fct)
@@ -1437,73 +2378,95 @@ def main():
                     print("No functions found.")
                     continue
                     
-                for idx, result in enumerate(results, 1):
-                    print(f"\n{idx}: {result.name} (Addr: 0x{result.address:08x})")
+                sys.stdout.write("".join(f"\n{idx}: {result.name} (Addr: 0x{result.address:08x})\n"
+                                         for idx, result in enumerate(results, 1)))
                     
                 print ("\nEnter index to show details (or 0 to skip): ")
-                try:
-                    idx = int(input("> ").strip())
-                    if 1 <= idx <= len(results):
-                        func = results[idx - 1]
-                        print(f"\nFunction: {func.name}")
-                        print(f"  Address: 0x{func.address:08x}")
-                        print(f"  Parameters:")
-                        for param in func.parameters:
-                            print(f"    - {param['name']} ({param['type']})")
-                        
-                        print(f"  Subfunctions called:")
-                        subcalls = parser.extract_subcalls(func.name)
-                        if not subcalls: print("    (None)")
-                        for call in subcalls: print(f"    - {call}")
-                except ValueError: pass
+                answer = ask("> ").strip()
+                # Blank, 0 or anything non-numeric skips without an exception.
+                idx = int(answer) if answer.isdecimal() else 0
+                if 1 <= idx <= len(results):
+                    func = results[idx - 1]
+                    out = [f"\nFunction: {func.name}\n",
+                           f"  Address: 0x{func.address:08x}\n",
+                           "  Parameters:\n"]
+                    for param in parser.get_parameters_for(func):
+                        out.append(f"    - {param['name']} ({param['type']})\n")
+                    
+                    out.append("  Subfunctions called:\n")
+                    subcalls = subcalls_cache.get(func.name)
+                    if subcalls is None:
+                        subcalls = subcalls_cache[func.name] = parser.extract_subcalls(func.name)
+                    if not subcalls: out.append("    (None)\n")
+                    for call in subcalls: out.append(f"    - {call}\n")
+                    sys.stdout.write("".join(out))
 
             elif mode == '2':
                 print("Enter parameter/structure/variable name to search:")
-                usr_var = input("> ").strip()
+                usr_var = ask("> ").strip()
                 if not usr_var: continue
                 
-                # Collect matches
-                matches = []
-                # Structs
-                for s in parser.structures:
-                    if usr_var.lower() in s.lower():
-                        matches.append(('Struct', s))
-                # Vars
-                for v, t in parser.global_vars_dwarf.items():
-                    if usr_var.lower() in v.lower():
-                        matches.append(('Variable', v, t))
-                
-                if not matches:
+                if struct_index is None:
+                    struct_names = list(parser.structures)
+                    var_items = list(parser.global_vars_dwarf.items())
+                    struct_index = _search_index(struct_names)
+                    var_index = _search_index([v for v, _ in var_items])
+
+                # Structs first, then variables, produced lazily: only one
+                # page (plus a one-item lookahead) is collected per "m".
+                needle = usr_var.lower()
+                found = chain(
+                    (('Struct', struct_names[i])
+                     for i in _iter_substring_indices(struct_index, needle, struct_names)),
+                    (('Variable',) + var_items[i]
+                     for i in _iter_substring_indices(var_index, needle, (v for v, _ in var_items))))
+                ahead = list(islice(found, _CLI_PAGE_SIZE + 1))
+                if not ahead:
                     print("No matches found.")
                     continue
-                    
-                print(f"\nFound {len(matches)} matches:")
-                for i, m in enumerate(matches, 1):
-                    if m[0] == 'Struct':
-                        print(f"{i}. [Struct] {m[1]}")
+
+                matches = []
+                while True:
+                    first = len(matches) + 1
+                    matches += ahead[:_CLI_PAGE_SIZE]
+                    ahead = ahead[_CLI_PAGE_SIZE:]
+                    if first == 1 and not ahead:
+                        out = [f"\nFound {len(matches)} matches:\n"]
                     else:
-                        print(f"{i}. [Variable] {m[1]} (Type: {m[2]})")
-                        
-                print("\nSelect index to explore (or 0 to cancel):")
-                try:
-                    sel = int(input("> ").strip())
-                    if 1 <= sel <= len(matches):
-                        selection = matches[sel-1]
-                        print("\n" + "-"*40)
-                        if selection[0] == 'Struct':
-                            print_struct_tree(selection[1])
+                        out = [f"\nMatches {first}-{len(matches)}:\n"]
+                    for i, m in enumerate(matches[first - 1:], first):
+                        if m[0] == 'Struct':
+                            out.append(f"{i}. [Struct] {m[1]}\n")
                         else:
-                            v_name, v_type = selection[1], selection[2]
-                            print(f"Variable: {v_name}")
-                            print(f"Type: {v_type}")
-                            base = v_type.replace('*','').replace('const ','').replace('volatile ','').replace('struct ','').strip()
-                            if base in parser.structures:
-                                print_struct_tree(base, indent="  ")
-                except ValueError: pass
+                            out.append(f"{i}. [Variable] {m[1]} (Type: {m[2]})\n")
+                    sys.stdout.write("".join(out))
+
+                    more = ", m for more" if ahead else ""
+                    print(f"\nSelect index to explore (or 0 to cancel{more}):")
+                    answer = ask("> ").strip()
+                    if not (ahead and answer.lower() == 'm'):
+                        break
+                    ahead += islice(found, _CLI_PAGE_SIZE)
+                # Blank, 0 or anything non-numeric skips without an exception.
+                sel = int(answer) if answer.isdecimal() else 0
+                if 1 <= sel <= len(matches):
+                    selection = matches[sel-1]
+                    out = ["\n" + "-"*40 + "\n"]
+                    if selection[0] == 'Struct':
+                        print_struct_tree(selection[1], out)
+                    else:
+                        v_name, v_type = selection[1], selection[2]
+                        out.append(f"Variable: {v_name}\nType: {v_type}\n")
+                        base = _TYPE_DECOR_RE.sub('', v_type).strip()
+                        if base in parser.structures:
+                            print_struct_tree(base, out, indent="  ")
+                    sys.stdout.write("".join(out))
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Standalone CLI only; as a library the host application owns logging config.
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
\ No newline at end of file
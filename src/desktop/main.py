@@ -15,12 +15,17 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import webview
-
-from backend.security import generate_token
 from desktop.worker import spawn_worker, wait_until_ready
 
+# pywebview (and the GUI toolkit it loads) and FastAPI are imported inside
+# main()/JsApi rather than here: the spawned worker re-imports this module as
+# ``__mp_main__`` and has no window to drive, so top-level imports would be
+# paid again in every worker start.
+if TYPE_CHECKING:
+    import webview
+
 logger = logging.getLogger(__name__)
 
 WINDOW_TITLE = "Architecture Validator"
@@ -221,10 +226,14 @@ class JsApi:
                 pass
 
     def pick_folder(self) -> str | None:
+        import webview
+
         res = self._window.create_file_dialog(webview.FOLDER_DIALOG)
         return res[0] if res else None
 
     def pick_open_file(self, file_types: list[str] | None = None) -> str | None:
+        import webview
+
         res = self._window.create_file_dialog(
             webview.OPEN_DIALOG,
             allow_multiple=False,
@@ -233,6 +242,8 @@ class JsApi:
         return res[0] if res else None
 
     def pick_save_file(self, default_name: str = "") -> str | None:
+        import webview
+
         res = self._window.create_file_dialog(
             webview.SAVE_DIALOG, save_filename=default_name or ""
         )
@@ -242,6 +253,10 @@ class JsApi:
 
 
 def main() -> None:
+    import webview
+
+    from backend.security import generate_token
+
     logging.basicConfig(level=logging.INFO)
 
     # Fail fast with a helpful dialog if the Windows webview/.NET runtimes are
@@ -87,8 +87,13 @@ def spawn_worker(token: str, timeout: float = 30.0):
     return proc, port, parent_conn
 
 
-def wait_until_ready(port: int, timeout: float = 20.0, interval: float = 0.1) -> bool:
-    """Poll ``/api/health`` until the worker accepts connections."""
+def wait_until_ready(port: int, timeout: float = 20.0, interval: float = 0.02) -> bool:
+    """Poll ``/api/health`` until the worker accepts connections.
+
+    A refused localhost connect costs microseconds, so the poll interval is
+    kept short: the window opens as soon as uvicorn is up instead of up to a
+    whole interval later.
+    """
     deadline = time.monotonic() + timeout
     url = f"http://127.0.0.1:{port}/api/health"
     while time.monotonic() < deadline:
@@ -280,12 +280,15 @@ fn parse_elf_impl(elf_path: &str) -> PyResult<String> {
             Err(_) => continue,
         };
 
+        // Same STT_* labels pyelftools reports, so the Python side (globals
+        // filter, statistics, DB rows) sees identical data on either backend.
         let sym_type = match symbol.kind() {
             SymbolKind::Text => "STT_FUNC",
-            SymbolKind::Data => "OBJECT",
-            SymbolKind::Section => "SECTION",
-            SymbolKind::File => "FILE",
-            SymbolKind::Label => "NOTYPE",
+            SymbolKind::Data => "STT_OBJECT",
+            SymbolKind::Section => "STT_SECTION",
+            SymbolKind::File => "STT_FILE",
+            SymbolKind::Label => "STT_NOTYPE",
+            SymbolKind::Tls => "STT_TLS",
             _ => "UNKNOWN",
         };
 